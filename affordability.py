@@ -0,0 +1,154 @@
+"""
+Lender affordability: interest cover ratio (ICR) stress tests and loan-to-value caps, for lender rules × deals.
+
+A BTL lender wants the LTR rent to cover the mortgage payment at a stressed rate by some margin (e.g. 125% for
+limited companies / basic-rate taxpayers, 145% for higher-rate). Payments come from
+`calc.monthly_mortgage_payment_array` and are linear in the loan, so the largest loan a rule allows is the rent
+it credits divided by (ICR × payment per £1 borrowed), capped by the LTV. Every figure is a (rules, deals) array.
+
+    python affordability.py deals.csv lenders.csv results.csv
+"""
+import argparse
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from calc import LtrInputs, PurchaseInputs, deal_inputs, evaluate_purchase, monthly_mortgage_payment_array
+
+
+@dataclass(frozen=True)
+class LenderRule:
+    name: str
+    icr: float = 125.0                  # % of the stressed payment the rent must cover
+    stress_rate: float = 5.5            # % floor for the stressed rate
+    stress_margin: float = 2.0          # pp over the pay rate; stressed rate = max(floor, pay rate + margin)
+    max_ltv: float = 75.0               # %
+    repayment_basis: bool = False       # stress the full repayment payment (most lenders use interest-only)
+
+
+# Typical criteria, for the app's rules table.
+SAMPLE_RULES = (
+    LenderRule("Ltd company / basic rate", 125.0, 5.5, 2.0, 75.0),
+    LenderRule("Higher-rate taxpayer", 145.0, 5.5, 2.0, 75.0),
+    LenderRule("5y fixed (pay rate)", 125.0, 0.0, 0.0, 75.0),
+    LenderRule("High LTV, strict ICR", 160.0, 6.0, 2.0, 80.0),
+    LenderRule("Repayment stress", 125.0, 5.5, 0.0, 75.0, repayment_basis=True),
+)
+
+
+@dataclass(frozen=True)
+class LenderRules:
+    """Columnar rule table: one array per LenderRule field."""
+    name: np.ndarray
+    icr: np.ndarray
+    stress_rate: np.ndarray
+    stress_margin: np.ndarray
+    max_ltv: np.ndarray
+    repayment_basis: np.ndarray
+
+    @classmethod
+    def from_list(cls, rules) -> "LenderRules":
+        return cls.from_columns({f.name: [getattr(r, f.name) for r in rules] for f in fields(LenderRule)})
+
+    @classmethod
+    def from_columns(cls, columns) -> "LenderRules":
+        """From a mapping of field -> values (dict of lists, DataFrame, ...); missing fields take the defaults."""
+        n = len(columns["name"])
+        out = {}
+        for f in fields(LenderRule):
+            values = np.asarray(columns[f.name]) if f.name in columns else np.full(n, f.default)
+            out[f.name] = values.astype(str if f.name == "name" else bool if f.name == "repayment_basis" else float)
+        return cls(**out)
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+
+@dataclass(frozen=True)
+class Affordability:
+    """Every array is (rules, deals)."""
+    names: np.ndarray
+    loan: np.ndarray            # requested loan, per deal (1, deals)
+    stressed_rate: np.ndarray   # %
+    icr: np.ndarray             # rent / stressed payment at the requested loan, %
+    ltv: np.ndarray             # requested loan / price, % (1, deals)
+    max_loan_icr: np.ndarray
+    max_loan_ltv: np.ndarray
+    max_loan: np.ndarray        # min of the two
+    passes: np.ndarray          # requested loan within max_loan
+
+    def shortfall(self) -> np.ndarray:
+        """Extra deposit needed to pass each rule (0 where it already does)."""
+        return np.maximum(self.loan - self.max_loan, 0.0)
+
+    def summary(self) -> dict[str, np.ndarray]:
+        """Per deal: how many rules pass, and the largest loan any rule allows (with which rule)."""
+        best = np.argmax(self.max_loan, axis=0)
+        return {
+            "lenders_passing": self.passes.sum(axis=0),
+            "best_max_loan": np.max(self.max_loan, axis=0),
+            "best_lender": self.names[best],
+        }
+
+    def table(self, deal: int = 0) -> dict[str, list]:
+        col = lambda a: np.broadcast_to(a, self.max_loan.shape)[:, deal].tolist()  # noqa: E731
+        return {
+            "Lender rule": self.names.tolist(),
+            "Stressed rate (%)": col(self.stressed_rate),
+            "ICR achieved (%)": col(self.icr),
+            "Max loan (ICR) (£)": col(self.max_loan_icr),
+            "Max loan (LTV) (£)": col(self.max_loan_ltv),
+            "Max loan (£)": col(self.max_loan),
+            "Extra deposit needed (£)": col(self.shortfall()),
+            "Passes": col(self.passes),
+        }
+
+
+def affordability(rules: LenderRules, purchase: PurchaseInputs = PurchaseInputs(),
+                  ltr: LtrInputs = LtrInputs()) -> Affordability:
+    """Test every deal (scalars or arrays in `purchase` / `ltr`) against every rule in one pass."""
+    price = np.atleast_1d(np.asarray(purchase.price, dtype=float))[None, :]
+    loan = np.atleast_1d(np.asarray(evaluate_purchase(purchase).loan, dtype=float))[None, :]
+    rate = np.atleast_1d(np.asarray(purchase.rate, dtype=float))[None, :]
+    term = np.atleast_1d(np.asarray(purchase.term, dtype=float))[None, :]
+    rent = np.atleast_1d(np.asarray(ltr.monthly_rent, dtype=float))[None, :]
+    loan, price, rate, term, rent = np.broadcast_arrays(loan, price, rate, term, rent)
+
+    stressed = np.maximum(rules.stress_rate[:, None], rate + rules.stress_margin[:, None])
+    # Monthly payment per £1 borrowed at the stressed rate.
+    per_pound = monthly_mortgage_payment_array(1.0, stressed, term, ~rules.repayment_basis[:, None])
+    icr_ratio = rules.icr[:, None] / 100.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        icr = np.where(loan * per_pound > 0, rent / (loan * per_pound) * 100.0, np.inf)
+        max_loan_icr = np.where(per_pound > 0, rent / (icr_ratio * per_pound), np.inf)
+        ltv = np.where(price > 0, loan / price * 100.0, 0.0)
+    max_loan_ltv = price * rules.max_ltv[:, None] / 100.0
+    max_loan = np.minimum(max_loan_icr, max_loan_ltv)
+    return Affordability(rules.name, loan, stressed, icr, ltv, max_loan_icr, max_loan_ltv, max_loan,
+                         loan <= max_loan + 1e-6)
+
+
+def main(argv=None):
+    from batch import evaluate_frame, file_format, read_deals, write_results
+
+    parser = argparse.ArgumentParser(description="Screen every deal in a file against a table of lender rules.")
+    parser.add_argument("deals", help="deals file (.csv, .jsonl or .parquet), input columns as in batch.py")
+    parser.add_argument("rules", help="lender rules file with columns named like LenderRule (name, icr, ...)")
+    parser.add_argument("output", help="results file (.csv, .jsonl or .parquet), or - for stdout")
+    args = parser.parse_args(argv)
+
+    deals = read_deals(args.deals, file_format(args.deals))
+    rules = LenderRules.from_columns(read_deals(args.rules, file_format(args.rules)))
+    purchase, ltr, _ = deal_inputs(deals)
+    result = affordability(rules, purchase, ltr)
+
+    out = evaluate_frame(deals)
+    for key, values in result.summary().items():
+        out[key] = values
+    for i, name in enumerate(rules.name):
+        out[f"max_loan[{name}]"] = result.max_loan[i]
+    write_results(out, args.output, file_format(args.output))
+
+
+if __name__ == "__main__":
+    main()
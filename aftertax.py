@@ -0,0 +1,137 @@
+"""
+After-tax cashflow for UK landlords: an individual under Section 24 vs a limited company under corporation tax,
+with the furnished holiday let (FHL) regime as a historical option for STR.
+
+- Individual: rental profit is NOI with no deduction for mortgage interest; the tax on it (at the landlord's
+  marginal rates, given their other income) is reduced by a 20% credit on the lesser of the interest, the
+  profit and income above the personal allowance (Section 24). Unused credit carried forward is not modelled.
+- Individual, FHL (abolished from April 2025): interest is fully deductible, as before Section 24.
+- Company: corporation tax on NOI less interest; profits are assumed retained (no dividend tax on extraction).
+
+Rates live in income_tax_rates.json and are compiled into the same band schedules as stamp duty. Everything is
+vectorized: NumPy arrays of deals, other incomes and structures broadcast against each other.
+"""
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from calc import LtrInputs, LtrResult, PurchaseInputs, PurchaseResult, StrInputs, StrResult, evaluate_deal
+from projection import amortization_schedule
+from stampduty import TaxTable
+
+RATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "income_tax_rates.json")
+STRUCTURES = ("individual", "company")
+
+
+@lru_cache(maxsize=None)
+def load_rates(path: str = RATES_PATH) -> dict:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    rates = {k: data[k] for k in ("personal_allowance", "allowance_taper_from", "finance_cost_credit_rate")}
+    rates["income_tax"] = {name: TaxTable.compile(name, spec) for name, spec in data["income_tax"].items()}
+    rates["corporation_tax"] = TaxTable.compile("corporation", data["corporation_tax"])
+    return rates
+
+
+@dataclass(frozen=True)
+class TaxInputs:
+    structure: str = "individual"     # "individual" (Section 24) or "company" (corporation tax)
+    other_income: float = 30000.0     # individual's other taxable income, £/yr; sets the marginal band
+    scottish_taxpayer: bool = False   # Scottish income tax bands
+    fhl: bool = False                 # tax the STR as a furnished holiday let (pre-April 2025 rules)
+
+
+@dataclass(frozen=True)
+class AfterTax:
+    interest_yr: float       # mortgage interest in the first year
+    taxable_profit: float    # individual: NOI (or NOI - interest under FHL); company: NOI - interest
+    tax_yr: float
+    cash_yr: float           # after tax
+    cash_mo: float
+    coc: float               # after-tax cash-on-cash, %
+
+
+def _scalar_or_array(x):
+    return float(x) if np.ndim(x) == 0 else x
+
+
+def income_tax(income, scottish_taxpayer=False, path: str = RATES_PATH):
+    """Income tax on total taxable income (before the personal allowance, which tapers above £100k)."""
+    rates = load_rates(path)
+    income = np.maximum(np.asarray(income, dtype=float), 0.0)
+    allowance = np.maximum(rates["personal_allowance"] - np.maximum(income - rates["allowance_taper_from"], 0.0) / 2,
+                           0.0)
+    taxable = np.maximum(income - allowance, 0.0)
+    ruk = rates["income_tax"]["ruk"].tax(taxable)
+    if not np.any(scottish_taxpayer):
+        return ruk
+    return np.where(scottish_taxpayer, rates["income_tax"]["scotland"].tax(taxable), ruk)
+
+
+def annual_interest(loan, rate, term, interest_only):
+    """Interest paid over the first 12 months of the mortgage."""
+    return amortization_schedule(loan, rate, term, interest_only, 12)["interest"].sum(axis=-1)
+
+
+def property_tax(noi_yr, interest_yr, tax: TaxInputs, fhl=False, path: str = RATES_PATH) -> tuple:
+    """(taxable profit, tax) for a year of NOI and mortgage interest; any argument may be an array."""
+    rates = load_rates(path)
+    noi_yr, interest_yr = np.asarray(noi_yr, dtype=float), np.asarray(interest_yr, dtype=float)
+    other = np.asarray(tax.other_income, dtype=float)
+    deduct_interest = np.asarray(fhl, dtype=bool)
+
+    # Individual: marginal income tax on the profit, less the Section 24 basic-rate credit unless FHL.
+    profit = np.where(deduct_interest, noi_yr - interest_yr, noi_yr)
+    base = income_tax(other, tax.scottish_taxpayer, path)
+    extra = income_tax(other + np.maximum(profit, 0.0), tax.scottish_taxpayer, path) - base
+    above_allowance = np.maximum(other + np.maximum(profit, 0.0) - rates["personal_allowance"], 0.0)
+    relief = np.minimum(np.minimum(interest_yr, np.maximum(profit, 0.0)), above_allowance)
+    credit = np.where(deduct_interest, 0.0, rates["finance_cost_credit_rate"] * relief)
+    personal = np.maximum(extra - credit, -base) + 0.0  # + 0.0 turns -0.0 (base 0) into 0.0
+
+    # Company: corporation tax on profit after interest (losses pay nothing; carry-forward not modelled).
+    company_profit = noi_yr - interest_yr
+    company = rates["corporation_tax"].tax(np.maximum(company_profit, 0.0))
+
+    is_company = np.asarray(tax.structure) == "company"
+    return np.where(is_company, company_profit, profit), np.where(is_company, company, personal)
+
+
+def after_tax(noi_yr, cash_yr, interest_yr, upfront_cash, tax: TaxInputs, fhl=False) -> AfterTax:
+    taxable, tax_yr = property_tax(noi_yr, interest_yr, tax, fhl)
+    cash = np.asarray(cash_yr, dtype=float) - tax_yr
+    upfront = np.asarray(upfront_cash, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coc = np.where(upfront > 0, cash / np.where(upfront > 0, upfront, 1.0) * 100.0, 0.0)
+    return AfterTax(*(_scalar_or_array(x) for x in (interest_yr, taxable, tax_yr, cash, cash / 12.0, coc)))
+
+
+def evaluate_after_tax(tax: TaxInputs, purchase_in: PurchaseInputs, purchase: PurchaseResult, ltr: LtrResult,
+                       str_: StrResult) -> tuple[AfterTax, AfterTax]:
+    """(LTR, STR) after tax; FHL treatment only ever applies to the STR."""
+    interest = annual_interest(purchase.loan, purchase_in.rate, purchase_in.term, purchase_in.interest_only)
+    return (after_tax(ltr.noi_yr, ltr.cash_yr, interest, purchase.upfront_cash, tax),
+            after_tax(str_.noi_yr, str_.cash_yr, interest, purchase.upfront_cash, tax, fhl=tax.fhl))
+
+
+def compare_structures(purchase_in: PurchaseInputs, ltr_in: LtrInputs, str_in: StrInputs, other_incomes,
+                       scottish_taxpayer: bool = False, fhl: bool = False) -> dict[str, list]:
+    """Long table of after-tax annual cashflow for each ownership structure × other income, in one pass."""
+    deal = evaluate_deal(purchase_in, ltr_in, str_in)
+    other = np.asarray(other_incomes, dtype=float)
+    grid = TaxInputs(structure=np.array(STRUCTURES)[:, None], other_income=other[None, :],
+                     scottish_taxpayer=scottish_taxpayer, fhl=fhl)
+    lt, st_ = evaluate_after_tax(grid, purchase_in, deal.purchase, deal.ltr, deal.str_)
+    shape = (len(STRUCTURES), other.size)
+    flat = lambda x: np.broadcast_to(x, shape).ravel().tolist()  # noqa: E731
+    return {
+        "Structure": flat(np.array([s.capitalize() for s in STRUCTURES])[:, None]),
+        "Other income (£)": flat(other[None, :]),
+        "LTR tax (£/yr)": flat(lt.tax_yr),
+        "LTR after-tax cashflow (£/yr)": flat(lt.cash_yr),
+        "STR tax (£/yr)": flat(st_.tax_yr),
+        "STR after-tax cashflow (£/yr)": flat(st_.cash_yr),
+    }
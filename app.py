@@ -1,66 +1,257 @@
+import csv
+import io
+from dataclasses import MISSING, asdict, fields
 
-import math
 import numpy as np
-import pandas as pd
 import streamlit as st
-import altair as alt
+# pandas and altair are imported inside the functions that use them rather than here, so the sidebar and the
+# first tab's metrics are sent before they load. They still load on the first render: st.dataframe converts the
+# dict tables through pandas, and Streamlit runs every tab and expander body on each run.
+
+from affordability import SAMPLE_RULES, LenderRule, LenderRules, affordability
+from aftertax import TaxInputs, compare_structures, evaluate_after_tax
+from calc import (
+    DealResult, LtrInputs, PurchaseInputs, PurchaseResult, StrInputs,
+)
+from goalseek import goal_seek
+from graph import DealGraph
+from maxbid import max_offer
+from mortgage import SAMPLE_PRODUCTS, MortgageProduct, Products, compare_products, payment_schedule
+from montecarlo import Normal, ScenarioStats, Triangular, simulate
+from projection import Projection, ProjectionInputs, project
+from scenarios import ScenarioStore, mortgage_variants
+from store import DealStore
+from seasonal import SeasonalStr, seasonal_str
+from sensitivity import str_sensitivity
+from stampduty import load_regimes
 
 st.set_page_config(page_title="Hitch Property Management Calculator", page_icon="🏠", layout="wide")
 st.title("🏠 Hitch Property Management Calculator")
-st.caption("Quick, flexible modelling for long-term (LTR) and short-term (STR) lets — with BTL SDLT estimate (England & NI).")
-
-# ---------------------------- Helpers ----------------------------
-def sdlt_btl_england(price: float) -> float:
+st.caption("Quick, flexible modelling for long-term (LTR) and short-term (STR) lets — with BTL stamp duty estimates (SDLT, LBTT + ADS, LTT).")
+
+# ---------------------------- Cached steps ----------------------------
+# Every widget change reruns the script; these are keyed on their inputs (frozen dataclasses / plain values),
+# so e.g. moving an STR slider reuses any unchanged chart.
+CACHE = dict(max_entries=256, ttl=3600)
+
+def deal_graph() -> DealGraph:
+    """Per-session calculation graph: each rerun feeds it the widget values and only the affected nodes recompute."""
+    if "deal_graph" not in st.session_state:
+        st.session_state.deal_graph = DealGraph()
+    return st.session_state.deal_graph
+
+def seeded(key: str, value) -> str:
+    """Widget key whose starting value is `value`, set once per session: a default derived from other inputs would
+    otherwise change the widget's identity on every sidebar edit and reset what the user typed."""
+    if key not in st.session_state:
+        st.session_state[key] = value
+    return key
+
+def named_rows(edited, cls) -> tuple[dict, int]:
+    """
+    st.data_editor output (dict or DataFrame) as plain column lists for the `cls` dataclass, dropping rows left
+    without a name. Blank cells take the field default; named rows missing a field with no default are dropped
+    too, and counted. Returns (columns, rows dropped).
+    """
+    columns = {k: list(v.values()) if isinstance(v, dict) else list(v) for k, v in dict(edited).items()}
+    blank = lambda x: x is None or isinstance(x, float) and np.isnan(x)  # noqa: E731
+    rows, dropped = {f.name: [] for f in fields(cls)}, 0
+    for i, name in enumerate(columns["name"]):
+        if not name:
+            continue
+        row = {f.name: f.default if blank(columns[f.name][i]) else columns[f.name][i] for f in fields(cls)}
+        if any(value is MISSING for value in row.values()):
+            dropped += 1
+            continue
+        for k, value in row.items():
+            rows[k].append(value)
+    return rows, dropped
+
+def to_csv(columns: dict) -> str:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(columns)
+    writer.writerows(zip(*columns.values()))
+    return buf.getvalue()
+
+MONTHS = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]
+
+@st.cache_data(**CACHE)
+def monthly_chart(ltr_m: tuple, str_m: tuple, series: tuple):
+    """ltr_m / str_m = (revenue, costs, profit) per month, each a flat value or 12 monthly values."""
+    import altair as alt
+    import pandas as pd
+
+    def both(i):
+        return np.concatenate([np.broadcast_to(np.asarray(ltr_m[i], dtype=float), (12,)),
+                               np.broadcast_to(np.asarray(str_m[i], dtype=float), (12,))])
+    df = pd.DataFrame({
+        "Month": MONTHS * 2,
+        "Scenario": ["Long-term"]*12 + ["Short-term"]*12,
+        "Revenue": both(0),
+        "Costs": both(1),
+        "Profit": both(2)
+    })
+    return alt.Chart(df).mark_line(point=True).encode(
+        x=alt.X('Month:N', sort=MONTHS),
+        y=alt.Y(alt.repeat('column'), type='quantitative', title='£ per month'),
+        color='Scenario:N'
+    ).repeat(column=list(series)).resolve_scale(y='independent')
+
+@st.cache_data(**CACHE)
+def annual_chart(ltr_y: tuple, str_y: tuple, series: tuple):
+    """ltr_y / str_y = (revenue, costs, profit) per year."""
+    import altair as alt
+    import pandas as pd
+
+    df = pd.DataFrame({
+        "Scenario": ["Long-term","Short-term"],
+        "Revenue": [ltr_y[0], str_y[0]],
+        "Costs": [ltr_y[1], str_y[1]],
+        "Profit": [ltr_y[2], str_y[2]]
+    })
+    return alt.Chart(df).transform_fold(
+        list(series), as_=['Metric','Value']
+    ).mark_bar().encode(
+        x='Scenario:N', y='Value:Q', color='Metric:N'
+    )
+
+@st.cache_data(**CACHE)
+def str_heatmap(inputs: StrInputs, purchase: PurchaseResult, occ_range: tuple, nightly_range: tuple, steps: int, metric: str):
+    """Altair heatmap of `metric` ("cash_yr" or "coc") over an occupancy × nightly grid."""
+    import altair as alt
+    import pandas as pd
+
+    occ = np.linspace(occ_range[0], occ_range[1], steps)
+    nightly = np.linspace(nightly_range[0], nightly_range[1], steps)
+    grid = str_sensitivity(inputs, purchase, occ, nightly)
+    # Cell edges, so the rectangles tile the quantitative axes.
+    d_occ = (occ[1] - occ[0]) / 2 if steps > 1 else 0.5
+    d_nightly = (nightly[1] - nightly[0]) / 2 if steps > 1 else 0.5
+    occ_g, nightly_g = np.meshgrid(occ, nightly, indexing="ij")
+    title = "Annual cashflow (£)" if metric == "cash_yr" else "Cash-on-cash (%)"
+    df = pd.DataFrame({
+        "occ_lo": (occ_g - d_occ).ravel(), "occ_hi": (occ_g + d_occ).ravel(),
+        "nightly_lo": (nightly_g - d_nightly).ravel(), "nightly_hi": (nightly_g + d_nightly).ravel(),
+        "Occupancy (%)": occ_g.ravel(), "Nightly (£)": nightly_g.ravel(),
+        title: getattr(grid, metric).ravel(),
+    })
+    return alt.Chart(df).mark_rect().encode(
+        x=alt.X("nightly_lo:Q", title="Nightly rate (£)", scale=alt.Scale(zero=False, nice=False)), x2="nightly_hi:Q",
+        y=alt.Y("occ_lo:Q", title="Occupancy (%)", scale=alt.Scale(zero=False, nice=False)), y2="occ_hi:Q",
+        color=alt.Color(f"{title}:Q", scale=alt.Scale(scheme="redyellowgreen", domainMid=0)),
+        tooltip=["Occupancy (%):Q", "Nightly (£):Q", alt.Tooltip(f"{title}:Q", format=",.1f")],
+    )
+
+@st.cache_data(**CACHE)
+def cached_simulation(purchase_in: PurchaseInputs, ltr_in: LtrInputs, str_in: StrInputs, dists: dict, n: int,
+                      bins: int = 60) -> tuple[ScenarioStats, ScenarioStats, np.ndarray, np.ndarray, np.ndarray]:
     """
-    SDLT for additional property (BTL) in England & NI (effective +5% surcharge on standard bands).
-    Effective bands: 5% to £125k, 7% to £250k, 10% to £925k, 15% to £1.5m, 17% above.
+    (LTR stats, STR stats, bin edges, LTR shares, STR shares) of annual cashflow. The paths are binned here and
+    dropped, so the cache holds a few hundred numbers per entry instead of every sample.
     """
-    bands = [(125000, 0.05), (250000, 0.07), (925000, 0.10), (1500000, 0.15), (float('inf'), 0.17)]
-    tax = 0.0
-    prev = 0.0
-    for t, rate in bands:
-        slice_amt = min(price, t) - prev
-        if slice_amt > 0:
-            tax += slice_amt * rate
-            prev = t
-        if price <= t:
-            break
-    return max(tax, 0.0)
-
-def monthly_mortgage_payment(principal: float, annual_rate: float, years: int, interest_only: bool) -> float:
-    r = annual_rate/100.0/12.0
-    n = years*12
-    if principal <= 0 or annual_rate < 0 or years <= 0:
-        return 0.0
-    if interest_only:
-        return principal * r
-    if r == 0:
-        return principal / n
-    return principal * (r * (1 + r) ** n) / ((1 + r) ** n - 1)
+    mc = simulate(purchase_in, ltr_in, str_in, dists, n=n, seed=0)
+    lt_cash_yr, st_cash_yr = mc.samples["lt_cash_yr"], mc.samples["st_cash_yr"]
+    edges = np.histogram_bin_edges(np.concatenate([lt_cash_yr, st_cash_yr]), bins=bins)
+    lt_share = np.histogram(lt_cash_yr, bins=edges)[0] / n
+    st_share = np.histogram(st_cash_yr, bins=edges)[0] / n
+    return mc.ltr, mc.str_, edges, lt_share, st_share
+
+@st.cache_data(**CACHE)
+def cashflow_histogram(edges: np.ndarray, lt_share: np.ndarray, st_share: np.ndarray):
+    """Pre-binned histogram of simulated annual cashflow, so the chart carries one row per bin, not every path."""
+    import altair as alt
+    import pandas as pd
+
+    frames = [pd.DataFrame({"Scenario": label, "lo": edges[:-1], "hi": edges[1:], "Share": share})
+              for label, share in (("Long-term", lt_share), ("Short-term", st_share))]
+    return alt.Chart(pd.concat(frames)).mark_bar(opacity=0.6).encode(
+        x=alt.X("lo:Q", title="Annual cashflow (£)"), x2="hi:Q",
+        y=alt.Y("Share:Q", stack=None, axis=alt.Axis(format="%")),
+        color="Scenario:N",
+    )
+
+@st.cache_data(**CACHE)
+def cached_projection(purchase_in: PurchaseInputs, purchase: PurchaseResult, ltr_in: LtrInputs, str_in: StrInputs,
+                      proj: ProjectionInputs) -> Projection:
+    return project(purchase_in, purchase, ltr_in, str_in, proj)
+
+@st.cache_data(**CACHE)
+def projection_chart(lt_cash_y: np.ndarray, st_cash_y: np.ndarray, equity_y: np.ndarray):
+    import altair as alt
+    import pandas as pd
+
+    years = np.arange(1, lt_cash_y.size + 1)
+    cash = pd.DataFrame({
+        "Year": np.concatenate([years, years]),
+        "Scenario": ["Long-term"] * years.size + ["Short-term"] * years.size,
+        "Cashflow (£)": np.concatenate([lt_cash_y, st_cash_y]),
+    })
+    equity = pd.DataFrame({"Year": years, "Equity (£)": equity_y})
+    bars = alt.Chart(cash).mark_bar().encode(x="Year:O", xOffset="Scenario:N", y="Cashflow (£):Q", color="Scenario:N")
+    line = alt.Chart(equity).mark_line(point=True, color="black").encode(x="Year:O", y="Equity (£):Q")
+    return alt.layer(bars, line).resolve_scale(y="independent")
+
+@st.cache_data(**CACHE)
+def cached_seasonal(inputs: StrInputs, purchase: PurchaseResult, nightly_profile, occupancy_profile) -> SeasonalStr:
+    return seasonal_str(inputs, purchase, nightly_profile, occupancy_profile)
+
+@st.cache_resource
+def deal_store() -> DealStore:
+    return DealStore()
+
+@st.cache_data(**CACHE)
+def scenario_comparison(names: tuple, columns: dict) -> dict:
+    store = ScenarioStore()
+    store.names, store.columns = list(names), columns
+    return store.comparison()
+
+@st.cache_data(**CACHE)
+def scenario_chart(comparison: dict, metric: str):
+    import altair as alt
+    import pandas as pd
+
+    return alt.Chart(pd.DataFrame(comparison)).mark_bar().encode(
+        y=alt.Y("Scenario:N", sort=None, title=None), yOffset="Strategy:N",
+        x=alt.X(f"{metric}:Q"), color="Strategy:N",
+        tooltip=["Scenario:N", "Strategy:N", alt.Tooltip(f"{metric}:Q", format=",.2f")],
+    )
+
+@st.cache_data(**CACHE)
+def cached_structures(purchase_in: PurchaseInputs, ltr_in: LtrInputs, str_in: StrInputs, other_incomes: tuple,
+                      scottish: bool, fhl: bool) -> dict:
+    return compare_structures(purchase_in, ltr_in, str_in, other_incomes, scottish, fhl)
+
+@st.cache_data(**CACHE)
+def cached_affordability(rules: dict, purchase_in: PurchaseInputs, ltr_in: LtrInputs) -> dict:
+    return affordability(LenderRules.from_columns(rules), purchase_in, ltr_in).table()
+
+@st.cache_data(**CACHE)
+def cached_products(products: dict, purchase_in: PurchaseInputs, horizon_years: int) -> dict:
+    return compare_products(Products.from_columns(products), purchase_in, horizon_years).table()
 
 # ---------------------------- Sidebar ----------------------------
 with st.sidebar:
     st.header("Purchase & Mortgage")
     price = st.number_input("Purchase price (£)", min_value=0.0, value=200000.0, step=1000.0, format="%.2f")
     deposit_pct = st.slider("Deposit (%)", 0.0, 100.0, 25.0, 1.0)
-    deposit = price * deposit_pct / 100.0
-    loan = max(price - deposit, 0.0)
 
     st.markdown("---")
     st.subheader("Mortgage")
     mtg_type = st.selectbox("Type", ["Repayment", "Interest-only"])
     rate = st.number_input("Interest rate (APR, %)", min_value=0.0, value=5.0, step=0.1, format="%.2f")
     term = st.number_input("Term (years)", min_value=1, value=25, step=1)
-    monthly_payment = monthly_mortgage_payment(loan, rate, term, mtg_type == "Interest-only")
 
     st.markdown("---")
     st.subheader("Stamp Duty (BTL)")
-    auto_sdlt = st.checkbox("Auto-calc SDLT (England/NI)", value=True)
+    regimes = load_regimes()
+    region = st.selectbox("Property location", list(regimes), format_func=lambda r: regimes[r].label)
+    auto_sdlt = st.checkbox("Auto-calc stamp duty", value=True)
     if auto_sdlt:
-        sdlt = sdlt_btl_england(price)
-        st.info(f"Calculated SDLT (BTL): **£{sdlt:,.0f}**")
+        manual_sdlt = None
+        sdlt_info = st.empty()  # filled in once the purchase is evaluated
     else:
-        sdlt = st.number_input("Enter SDLT manually (£)", min_value=0.0, value=0.0, step=100.0)
+        manual_sdlt = st.number_input("Enter stamp duty manually (£)", min_value=0.0, value=0.0, step=100.0)
 
     st.markdown("---")
     st.subheader("One-off purchase costs")
@@ -70,11 +261,21 @@ with st.sidebar:
     refurb = st.number_input("Refurb / furniture (£)", min_value=0.0, value=0.0, step=100.0)
     other_oa = st.number_input("Other one-off costs (£)", min_value=0.0, value=0.0, step=50.0)
 
-    upfront_cash = deposit + sdlt + legal + broker + survey + refurb + other_oa
-    st.success(f"**Upfront cash required:** £{upfront_cash:,.0f}")
+    purchase_inputs = PurchaseInputs(
+        price=price, deposit_pct=deposit_pct, interest_only=mtg_type == "Interest-only", rate=rate, term=term,
+        sdlt=manual_sdlt, region=region, legal=legal, broker=broker, survey=survey, refurb=refurb, other_oa=other_oa,
+    )
+    deal_graph().update(**asdict(purchase_inputs))
+    purchase = deal_graph().purchase()
+    if auto_sdlt:
+        sdlt_info.info(f"Calculated {regimes[region].label}: **£{purchase.sdlt:,.0f}**")
+    st.success(f"**Upfront cash required:** £{purchase.upfront_cash:,.0f}")
 
 # ---------------------------- Tabs ----------------------------
-tab1, tab2, tab3 = st.tabs(["📄 Long-term let (LTR)", "🛏️ Short-term let (STR)", "📊 Summary & Chart"])
+tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
+    "📄 Long-term let (LTR)", "🛏️ Short-term let (STR)", "📊 Summary & Chart", "🎯 STR sensitivity", "🎲 Risk (Monte Carlo)",
+    "📈 Projection", "🗂️ Scenarios",
+])
 
 # ---------------------------- LTR ----------------------------
 with tab1:
@@ -94,54 +295,58 @@ with tab1:
         other_mo = st.number_input("Other monthly costs (£)", min_value=0.0, value=0.0, step=25.0)
 
     # LTR calcs
-    lt_revenue_mo = monthly_rent
-    lt_revenue_yr = lt_revenue_mo * 12
-
-    mgmt_mo = monthly_rent * mgmt_pct_lt / 100.0
-    maint_mo = monthly_rent * maint_pct_lt / 100.0
-    voids_mo = monthly_rent * voids_pct / 100.0
-    fixed_mo = other_mo + (service_chg + ground_rent + insurance + letting_fees) / 12.0
-
-    lt_opex_mo = mgmt_mo + maint_mo + voids_mo + fixed_mo
-    lt_opex_yr = lt_opex_mo * 12
-    lt_noi_mo = lt_revenue_mo - lt_opex_mo
-    lt_noi_yr = lt_noi_mo * 12
-    lt_mort_mo = monthly_payment
-    lt_mort_yr = lt_mort_mo * 12
-    lt_cash_mo = lt_noi_mo - lt_mort_mo
-    lt_cash_yr = lt_cash_mo * 12
-    lt_gross_yield = (lt_revenue_yr / price * 100.0) if price else 0.0
-    lt_net_yield = (lt_noi_yr / price * 100.0) if price else 0.0
-    lt_coc = (lt_cash_yr / upfront_cash * 100.0) if upfront_cash > 0 else 0.0
+    ltr_inputs = LtrInputs(
+        monthly_rent=monthly_rent, voids_pct=voids_pct, mgmt_pct_lt=mgmt_pct_lt, maint_pct_lt=maint_pct_lt,
+        service_chg=service_chg, ground_rent=ground_rent, insurance=insurance, letting_fees=letting_fees,
+        other_mo=other_mo,
+    )
+    deal_graph().update(**asdict(ltr_inputs))
+    ltr = deal_graph().ltr()
 
     # Display
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Monthly revenue", f"£{lt_revenue_mo:,.0f}")
-        st.metric("Monthly opex", f"£{lt_opex_mo:,.0f}")
-        st.metric("Monthly mortgage", f"£{lt_mort_mo:,.0f}")
+        st.metric("Monthly revenue", f"£{ltr.revenue_mo:,.0f}")
+        st.metric("Monthly opex", f"£{ltr.opex_mo:,.0f}")
+        st.metric("Monthly mortgage", f"£{ltr.mort_mo:,.0f}")
     with col2:
-        st.metric("Monthly NOI", f"£{lt_noi_mo:,.0f}")
-        st.metric("Monthly cashflow", f"£{lt_cash_mo:,.0f}")
-        st.metric("Gross yield", f"{lt_gross_yield:,.2f}%")
+        st.metric("Monthly NOI", f"£{ltr.noi_mo:,.0f}")
+        st.metric("Monthly cashflow", f"£{ltr.cash_mo:,.0f}")
+        st.metric("Gross yield", f"{ltr.gross_yield:,.2f}%")
     with col3:
-        st.metric("Annual revenue", f"£{lt_revenue_yr:,.0f}")
-        st.metric("Annual opex", f"£{lt_opex_yr:,.0f}")
-        st.metric("Annual cashflow", f"£{lt_cash_yr:,.0f}")
+        st.metric("Annual revenue", f"£{ltr.revenue_yr:,.0f}")
+        st.metric("Annual opex", f"£{ltr.opex_yr:,.0f}")
+        st.metric("Annual cashflow", f"£{ltr.cash_yr:,.0f}")
 
     with st.expander("LTR breakdown (monthly & annual)"):
-        lt_table = pd.DataFrame({
+        lt_table = {
             "Metric": ["Revenue", "Operating costs", "NOI", "Mortgage", "Cashflow"],
-            "Monthly (£)": [lt_revenue_mo, lt_opex_mo, lt_noi_mo, lt_mort_mo, lt_cash_mo],
-            "Annual (£)": [lt_revenue_yr, lt_opex_yr, lt_noi_yr, lt_mort_yr, lt_cash_yr]
-        })
+            "Monthly (£)": [ltr.revenue_mo, ltr.opex_mo, ltr.noi_mo, ltr.mort_mo, ltr.cash_mo],
+            "Annual (£)": [ltr.revenue_yr, ltr.opex_yr, ltr.noi_yr, ltr.mort_yr, ltr.cash_yr]
+        }
         st.dataframe(lt_table, use_container_width=True)
-        extra = pd.DataFrame({
+        extra = {
             "Metric": ["Net yield (%)", "Cash-on-cash (%)"],
-            "Value": [lt_net_yield, lt_coc]
-        })
+            "Value": [ltr.net_yield, ltr.coc]
+        }
         st.dataframe(extra, use_container_width=True)
 
+    with st.expander("🏦 Lender affordability (ICR stress test)"):
+        st.caption("Rent must cover the payment at the stressed rate (the higher of the floor and the sidebar rate "
+                   "plus the margin) by the ICR. Max loan is the lower of the ICR and LTV limits.")
+        rules = st.data_editor(
+            {f: [getattr(r, f) for r in SAMPLE_RULES] for f in LenderRule.__dataclass_fields__},
+            num_rows="dynamic", use_container_width=True, key="lender_rules",
+        )
+        rules, _ = named_rows(rules, LenderRule)
+        if not rules["name"]:
+            st.info("Add at least one lender rule.")
+        else:
+            checks = cached_affordability(rules, purchase_inputs, ltr_inputs)
+            st.dataframe(checks, use_container_width=True, hide_index=True)
+            passing = sum(checks["Passes"])
+            st.caption(f"Loan requested: **£{purchase.loan:,.0f}**. Passes {passing} of {len(checks['Passes'])} rules.")
+
 # ---------------------------- STR ----------------------------
 with tab2:
     st.subheader("Short-term rental inputs")
@@ -159,122 +364,331 @@ with tab2:
         rates_annual = st.number_input("Council tax / business rates (annual, £)", min_value=0.0, value=0.0, step=50.0)
 
     # STR core maths
-    nights_year = 365 * (occupancy / 100.0)
-    stays_year = nights_year / float(avg_stay)  # stays = nights / avg_stay
-    cleaning_year = cost_per_clean * stays_year  # <-- Requested formula
-    cleaning_mo = cleaning_year / 12.0
-
-    revenue_year = nightly * nights_year
-    mgmt_year = revenue_year * mgmt_pct_str / 100.0
-    platform_year = revenue_year * platform_pct / 100.0
-    fixed_year = utilities_mo * 12 + rates_annual
-
-    opex_year = mgmt_year + platform_year + cleaning_year + fixed_year
-    opex_mo = opex_year / 12.0
-
-    noi_year = revenue_year - opex_year
-    noi_mo = noi_year / 12.0
-
-    mort_mo = monthly_payment
-    mort_yr = mort_mo * 12.0
-
-    cash_mo = noi_mo - mort_mo
-    cash_yr = cash_mo * 12.0
-
-    gross_yield_str = (revenue_year / price * 100.0) if price else 0.0
-    net_yield_str = (noi_year / price * 100.0) if price else 0.0
-    coc_str = (cash_yr / upfront_cash * 100.0) if upfront_cash > 0 else 0.0
+    str_inputs = StrInputs(
+        nightly=nightly, occupancy=occupancy, avg_stay=avg_stay, cost_per_clean=cost_per_clean,
+        mgmt_pct_str=mgmt_pct_str, platform_pct=platform_pct, utilities_mo=utilities_mo, rates_annual=rates_annual,
+    )
+    seasonal = None
+    with st.expander("Seasonal calendar (optional)"):
+        st.caption("CSV with 12 (monthly) or 365 (daily) rows and a `nightly` and/or `occupancy` column. "
+                   "A missing column stays flat at the value above.")
+        calendar_file = st.file_uploader("Calendar CSV", type="csv")
+        if calendar_file is not None:
+            import pandas as pd  # only needed once a calendar is uploaded
+
+            try:
+                calendar = pd.read_csv(calendar_file)
+            except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError):
+                calendar = pd.DataFrame()
+            columns = {name: pd.to_numeric(calendar[name], errors="coerce").to_numpy(float)
+                       for name in ("nightly", "occupancy") if name in calendar}
+            bad = [name for name, values in columns.items() if np.isnan(values).any()]
+            if len(calendar) not in (12, 365) or not columns:
+                st.error("Calendar needs 12 or 365 rows and a `nightly` and/or `occupancy` column; using flat inputs.")
+            elif bad:
+                st.error(f"Calendar column(s) {', '.join(f'`{name}`' for name in bad)} must be numbers in every row; "
+                         "using flat inputs.")
+            else:
+                seasonal = cached_seasonal(str_inputs, purchase, columns.get("nightly"), columns.get("occupancy"))
+                st.dataframe({
+                    "Month": MONTHS, "Nights": seasonal.nights, "Revenue (£)": seasonal.revenue,
+                    "Cleaning (£)": seasonal.cleaning, "Opex (£)": seasonal.opex, "Cashflow (£)": seasonal.cash,
+                }, use_container_width=True)
+    deal_graph().update(**asdict(str_inputs))
+    str_ = seasonal.annual if seasonal is not None else deal_graph().str_()
 
     # Display
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Monthly revenue", f"£{revenue_year/12:,.0f}")
-        st.metric("Monthly opex", f"£{opex_mo:,.0f}")
-        st.metric("Monthly mortgage", f"£{mort_mo:,.0f}")
+        st.metric("Monthly revenue", f"£{str_.revenue_mo:,.0f}")
+        st.metric("Monthly opex", f"£{str_.opex_mo:,.0f}")
+        st.metric("Monthly mortgage", f"£{str_.mort_mo:,.0f}")
     with col2:
-        st.metric("Monthly NOI", f"£{noi_mo:,.0f}")
-        st.metric("Monthly cashflow", f"£{cash_mo:,.0f}")
-        st.metric("Gross yield", f"{gross_yield_str:,.2f}%")
+        st.metric("Monthly NOI", f"£{str_.noi_mo:,.0f}")
+        st.metric("Monthly cashflow", f"£{str_.cash_mo:,.0f}")
+        st.metric("Gross yield", f"{str_.gross_yield:,.2f}%")
     with col3:
-        st.metric("Annual revenue", f"£{revenue_year:,.0f}")
-        st.metric("Annual opex", f"£{opex_year:,.0f}")
-        st.metric("Annual cashflow", f"£{cash_yr:,.0f}")
+        st.metric("Annual revenue", f"£{str_.revenue_yr:,.0f}")
+        st.metric("Annual opex", f"£{str_.opex_yr:,.0f}")
+        st.metric("Annual cashflow", f"£{str_.cash_yr:,.0f}")
 
-    st.caption(f"Cleaning cost = (365 × {occupancy:.0f}% ÷ {avg_stay}) × £{cost_per_clean} = £{cleaning_year:,.0f}/yr (≈ £{cleaning_mo:,.0f}/mo).")
+    if seasonal is None:
+        st.caption(f"Cleaning cost = (365 × {occupancy:.0f}% ÷ {avg_stay}) × £{cost_per_clean} = £{str_.cleaning_year:,.0f}/yr (≈ £{str_.cleaning_mo:,.0f}/mo).")
+    else:
+        st.caption(f"Seasonal calendar: {str_.nights_year:,.0f} nights/yr ÷ {avg_stay} × £{cost_per_clean} = £{str_.cleaning_year:,.0f}/yr cleaning.")
 
     with st.expander("STR breakdown (monthly & annual)"):
-        str_table = pd.DataFrame({
+        str_table = {
             "Metric": ["Revenue", "Operating costs", "NOI", "Mortgage", "Cashflow"],
-            "Monthly (£)": [revenue_year/12, opex_mo, noi_mo, mort_mo, cash_mo],
-            "Annual (£)": [revenue_year, opex_year, noi_year, mort_yr, cash_yr]
-        })
+            "Monthly (£)": [str_.revenue_mo, str_.opex_mo, str_.noi_mo, str_.mort_mo, str_.cash_mo],
+            "Annual (£)": [str_.revenue_yr, str_.opex_yr, str_.noi_yr, str_.mort_yr, str_.cash_yr]
+        }
         st.dataframe(str_table, use_container_width=True)
-        extra = pd.DataFrame({
+        extra = {
             "Metric": ["Net yield (%)", "Cash-on-cash (%)"],
-            "Value": [net_yield_str, coc_str]
-        })
+            "Value": [str_.net_yield, str_.coc]
+        }
         st.dataframe(extra, use_container_width=True)
 
 # ---------------------------- Summary & Chart ----------------------------
 with tab3:
     st.subheader("Summary")
-    summary = pd.DataFrame({
-        "Scenario": ["Long-term let", "Short-term let"],
-        "Monthly cashflow (£)": [ ( (monthly_rent - (monthly_rent*mgmt_pct_lt/100.0 + monthly_rent*maint_pct_lt/100.0 + monthly_rent*voids_pct/100.0 + (service_chg+ground_rent+insurance+letting_fees)/12.0)) - monthly_payment ),
-                                  cash_mo ],
-        "Annual cashflow (£)": [ (( (monthly_rent - (monthly_rent*mgmt_pct_lt/100.0 + monthly_rent*maint_pct_lt/100.0 + monthly_rent*voids_pct/100.0 + (service_chg+ground_rent+insurance+letting_fees)/12.0)) - monthly_payment )*12),
-                                 cash_yr ],
-        "Cash-on-cash (%)": [
-            ( (( (monthly_rent - (monthly_rent*mgmt_pct_lt/100.0 + monthly_rent*maint_pct_lt/100.0 + monthly_rent*voids_pct/100.0 + (service_chg+ground_rent+insurance+letting_fees)/12.0)) - monthly_payment )*12) / upfront_cash * 100.0 ) if upfront_cash>0 else 0.0,
-            ( cash_yr / upfront_cash * 100.0 ) if upfront_cash>0 else 0.0
-        ]
-    })
+    deal = DealResult(purchase, ltr, str_)
+    summary = deal.summary()
     st.dataframe(summary, use_container_width=True)
+    st.download_button("Download summary (CSV)", to_csv(summary), file_name="summary.csv", mime="text/csv")
 
     st.markdown("### Compare revenue, costs, and profit")
     show_annual = st.toggle("Show annual view", value=False)
     series = st.multiselect("Series", ["Revenue", "Costs", "Profit"], default=["Revenue", "Costs", "Profit"])
 
-    # LTR monthly/annual
-    ltr_rev_m = lt_revenue_mo
-    ltr_costs_m = lt_opex_mo + lt_mort_mo
-    ltr_profit_m = lt_cash_mo
-    ltr_rev_y, ltr_costs_y, ltr_profit_y = lt_revenue_yr, lt_opex_yr+lt_mort_yr, lt_cash_yr
-
-    # STR monthly/annual
-    str_rev_m = revenue_year/12
-    str_costs_m = opex_mo + mort_mo
-    str_profit_m = cash_mo
-    str_rev_y, str_costs_y, str_profit_y = revenue_year, opex_year+mort_yr, cash_yr
-
-    months = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]
-    if not show_annual:
-        df = pd.DataFrame({
-            "Month": months * 2,
-            "Scenario": ["Long-term"]*12 + ["Short-term"]*12,
-            "Revenue": [ltr_rev_m]*12 + [str_rev_m]*12,
-            "Costs": [ltr_costs_m]*12 + [str_costs_m]*12,
-            "Profit": [ltr_profit_m]*12 + [str_profit_m]*12
-        })
-        chart = alt.Chart(df).mark_line(point=True).encode(
-            x=alt.X('Month:N', sort=months),
-            y=alt.Y(alt.repeat('column'), type='quantitative', title='£ per month'),
-            color='Scenario:N'
-        ).repeat(column=series).resolve_scale(y='independent')
-        st.altair_chart(chart, use_container_width=True)
-    else:
-        df = pd.DataFrame({
-            "Scenario": ["Long-term","Short-term"],
-            "Revenue": [ltr_rev_y, str_rev_y],
-            "Costs": [ltr_costs_y, str_costs_y],
-            "Profit": [ltr_profit_y, str_profit_y]
-        })
-        chart = alt.Chart(df).transform_fold(
-            series, as_=['Metric','Value']
-        ).mark_bar().encode(
-            x='Scenario:N', y='Value:Q', color='Metric:N'
+    ltr_series, str_series = deal.revenue_costs_profit(annual=show_annual)
+    if seasonal is not None and not show_annual:
+        str_series = (seasonal.revenue, seasonal.opex + str_.mort_mo, seasonal.cash)
+    chart_fn = annual_chart if show_annual else monthly_chart
+    chart = chart_fn(ltr_series, str_series, tuple(series))
+    st.altair_chart(chart, use_container_width=True)
+
+    with st.expander("🧾 After tax (Section 24 vs limited company)"):
+        st.caption("Individuals pay income tax on NOI with only a 20% credit for mortgage interest (Section 24); "
+                   "companies pay corporation tax on profit after interest (retained, no dividend tax). "
+                   "First-year interest; 2024/25 rates.")
+        colA, colB, colC = st.columns(3)
+        with colA:
+            structure = st.radio("Owned by", ["Individual", "Company"], horizontal=True)
+        with colB:
+            other_income = st.number_input("Other taxable income (£/yr)", min_value=0.0, value=30000.0, step=1000.0,
+                                           disabled=structure == "Company")
+        with colC:
+            scottish_taxpayer = st.checkbox("Scottish taxpayer", disabled=structure == "Company")
+            fhl = st.checkbox("STR as furnished holiday let (pre-April 2025)", disabled=structure == "Company")
+        tax_inputs = TaxInputs(structure.lower(), other_income, scottish_taxpayer, fhl)
+        lt_tax, st_tax = evaluate_after_tax(tax_inputs, purchase_inputs, purchase, ltr, str_)
+        colA, colB = st.columns(2)
+        for col, label, before, after in ((colA, "LTR", ltr, lt_tax), (colB, "STR", str_, st_tax)):
+            with col:
+                st.metric(f"{label} tax (annual)", f"£{after.tax_yr:,.0f}")
+                st.metric(f"{label} after-tax cashflow (monthly)", f"£{after.cash_mo:,.0f}",
+                          delta=f"£{after.cash_mo - before.cash_mo:,.0f} vs pre-tax", delta_color="off")
+                st.metric(f"{label} after-tax cash-on-cash", f"{after.coc:,.2f}%")
+        st.markdown("**Individual vs company across income levels**")
+        incomes = tuple(sorted({other_income, 20000.0, 50000.0, 100000.0, 150000.0}))
+        st.dataframe(cached_structures(purchase_inputs, ltr_inputs, str_inputs, incomes, scottish_taxpayer, fhl),
+                     use_container_width=True, hide_index=True)
+
+    with st.expander("🎯 Goal seek"):
+        # question -> (metric, input solved for, default target, unit, input label)
+        GOALS = {
+            "Break-even monthly rent (LTR cashflow = target £/mo)": ("lt_cash_mo", "monthly_rent", 0.0, "£", "Monthly rent"),
+            "Break-even occupancy (STR cashflow = target £/yr)": ("st_cash_yr", "occupancy", 0.0, "%", "Occupancy"),
+            "Occupancy for a target STR cash-on-cash (%)": ("st_coc", "occupancy", 8.0, "%", "Occupancy"),
+            "Nightly rate for a target STR cash-on-cash (%)": ("st_coc", "nightly", 8.0, "£", "Nightly rate"),
+            "Max purchase price for a target LTR net yield (%)": ("lt_net_yield", "price", 6.0, "£", "Purchase price"),
+            "Max purchase price for a target STR cash-on-cash (%)": ("st_coc", "price", 8.0, "£", "Purchase price"),
+        }
+        goal = st.selectbox("Solve for", list(GOALS))
+        metric_name, solve_for, default_target, unit, label = GOALS[goal]
+        target = st.number_input("Target", value=default_target, step=0.5)
+        answer = goal_seek(metric_name, target, solve_for, purchase_inputs, ltr_inputs, str_inputs)
+        if np.isnan(answer):
+            st.warning("No solution in range for this target.")
+        else:
+            st.success(f"{label}: **£{answer:,.0f}**" if unit == "£" else f"{label}: **{answer:,.1f}%**")
+            if solve_for == "occupancy" and not 0 <= answer <= 100:
+                st.caption("Outside 0–100%: the target can't be reached by occupancy alone.")
+
+    with st.expander("💷 Max offer"):
+        st.caption("Largest purchase price that fits your cash and/or yield limits, with stamp duty and one-off costs "
+                   "from the sidebar. Deposit % and the letting inputs stay as set.")
+        colA, colB, colC = st.columns(3)
+        with colA:
+            cash_budget = st.number_input("Cash available (£)", min_value=0.0, step=1000.0,
+                                          key=seeded("max_offer_cash", float(round(purchase.upfront_cash, -3))))
+        with colB:
+            target_yield = st.number_input("Min net yield (%)", min_value=0.0, value=0.0, step=0.25,
+                                           help="0 = no yield limit")
+        with colC:
+            bid_scenario = st.radio("Yield scenario", ["LTR", "STR"], horizontal=True)
+            bid_basis = st.radio("Yield on", ["Price", "Price + costs"], horizontal=True)
+        bid = max_offer(purchase_inputs, ltr_inputs, str_inputs, cash_budget=cash_budget,
+                        target_yield=target_yield or None, scenario=bid_scenario.lower(),
+                        basis="price" if bid_basis == "Price" else "cost")
+        if np.isnan(bid):
+            st.warning("No price meets these limits.")
+        else:
+            st.success(f"Max offer: **£{bid:,.0f}**")
+
+    with st.expander("🏦 Compare mortgage products"):
+        st.caption("Fixed rates revert to the lender's SVR after the fixed period. Fees below 1 are a share of the "
+                   "loan (0.03 = 3%). Loan, term and repayment type come from the sidebar.")
+        products = st.data_editor(
+            {f: [getattr(p, f) for p in SAMPLE_PRODUCTS] for f in MortgageProduct.__dataclass_fields__},
+            num_rows="dynamic", use_container_width=True, key="mortgage_products",
         )
-        st.altair_chart(chart, use_container_width=True)
+        products, incomplete = named_rows(products, MortgageProduct)
+        horizon_years = st.slider("Compare over (years)", 1, 10, 5)
+        if incomplete:
+            st.caption(f"Skipping {incomplete} product(s) without an initial rate, fixed period and reversion rate.")
+        if not products["name"]:
+            st.info("Add at least one complete product.")
+        else:
+            ranking = cached_products(products, purchase_inputs, horizon_years)
+            st.dataframe(ranking, use_container_width=True, hide_index=True)
+            best = MortgageProduct(**{k: v[products["name"].index(ranking["Product"][0])] for k, v in products.items()})
+            schedule = payment_schedule(best, purchase.loan, int(term), purchase_inputs.interest_only, horizon_years * 12)
+            st.caption(f"Cheapest over {horizon_years} years: **{best.name}**. Its monthly payments:")
+            st.line_chart({"Payment (£)": schedule["payment"], "Interest (£)": schedule["interest"]})
+
+# ---------------------------- STR sensitivity ----------------------------
+with tab4:
+    st.subheader("STR sensitivity: occupancy × nightly rate")
+    st.caption("Every other input is taken from the sidebar and the STR tab.")
+    colA, colB, colC = st.columns(3)
+    with colA:
+        occ_range = st.slider("Occupancy range (%)", 0.0, 100.0, (0.0, 100.0), 1.0)
+    with colB:
+        nightly_range = st.slider("Nightly rate range (£)", 0.0, 1000.0, (50.0, 400.0), 5.0)
+    with colC:
+        steps = st.slider("Grid steps per axis", 10, 200, 100, 10)
+        metric = st.radio("Metric", ["Annual cashflow", "Cash-on-cash"], horizontal=True)
+    heatmap = str_heatmap(str_inputs, purchase, occ_range, nightly_range, steps,
+                          "cash_yr" if metric == "Annual cashflow" else "coc")
+    st.altair_chart(heatmap, use_container_width=True)
+
+# ---------------------------- Monte Carlo ----------------------------
+with tab5:
+    st.subheader("Risk simulation")
+    st.caption("Uncertain inputs are drawn around the values set in the sidebar and the LTR/STR tabs; everything else stays fixed.")
+    colA, colB, colC = st.columns(3)
+    with colA:
+        rate_sd = st.number_input("Interest rate spread (± s.d., %)", min_value=0.0, value=1.0, step=0.25)
+        voids_hi = st.slider("Voids up to (% of rent)", 0.0, 50.0, step=1.0,
+                             key=seeded("mc_voids_hi", max(voids_pct, 15.0)))
+    with colB:
+        maint_hi = st.slider("Maintenance up to (% of rent)", 0.0, 25.0, step=0.5,
+                             key=seeded("mc_maint_hi", max(maint_pct_lt, 10.0)))
+        occ_sd = st.number_input("Occupancy spread (± s.d., %)", min_value=0.0, value=10.0, step=1.0)
+    with colC:
+        nightly_sd = st.number_input("Nightly rate spread (± s.d., £)", min_value=0.0, value=15.0, step=5.0)
+        n_paths = st.select_slider("Paths", [10_000, 100_000, 1_000_000], value=100_000)
+
+    dists = {
+        "rate": Normal(rate, rate_sd, low=0.0),
+        "voids_pct": Triangular(0.0, min(voids_pct, voids_hi), voids_hi),
+        "maint_pct_lt": Triangular(0.0, min(maint_pct_lt, maint_hi), maint_hi),
+        "occupancy": Normal(occupancy, occ_sd, low=0.0, high=100.0),
+        "nightly": Normal(nightly, nightly_sd, low=0.0),
+    }
+    lt_stats, st_stats, edges, lt_share, st_share = cached_simulation(purchase_inputs, ltr_inputs, str_inputs, dists,
+                                                                      n_paths)
+    stats = {
+        "Scenario": ["Long-term let", "Short-term let"],
+        "Annual cashflow P5 (£)": [lt_stats.cash_yr_p5, st_stats.cash_yr_p5],
+        "P50 (£)": [lt_stats.cash_yr_p50, st_stats.cash_yr_p50],
+        "P95 (£)": [lt_stats.cash_yr_p95, st_stats.cash_yr_p95],
+        "Cash-on-cash P5 (%)": [lt_stats.coc_p5, st_stats.coc_p5],
+        "P50 (%)": [lt_stats.coc_p50, st_stats.coc_p50],
+        "P95 (%)": [lt_stats.coc_p95, st_stats.coc_p95],
+        "P(cashflow < 0)": [lt_stats.prob_negative, st_stats.prob_negative],
+    }
+    st.dataframe(stats, use_container_width=True)
+    st.altair_chart(cashflow_histogram(edges, lt_share, st_share), use_container_width=True)
+
+# ---------------------------- Projection ----------------------------
+with tab6:
+    st.subheader("Multi-year projection")
+    colA, colB, colC = st.columns(3)
+    with colA:
+        proj_years = st.slider("Holding period (years)", 1, 40, 10, 1)
+        discount_rate = st.number_input("Discount rate for NPV (%/yr)", value=8.0, step=0.5)
+    with colB:
+        rent_growth = st.number_input("Rent / nightly rate growth (%/yr)", value=3.0, step=0.5)
+        cost_inflation = st.number_input("Cost inflation (%/yr)", value=3.0, step=0.5)
+    with colC:
+        capital_growth = st.number_input("Capital growth (%/yr)", value=3.0, step=0.5)
+        selling_costs_pct = st.number_input("Selling costs at exit (% of value)", min_value=0.0, value=2.0, step=0.5)
+    proj = cached_projection(purchase_inputs, purchase, ltr_inputs, str_inputs, ProjectionInputs(
+        years=proj_years, rent_growth=rent_growth, cost_inflation=cost_inflation, capital_growth=capital_growth,
+        discount_rate=discount_rate, selling_costs_pct=selling_costs_pct,
+    ))
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("LTR IRR", f"{proj.lt_irr:,.2f}%")
+        st.metric("STR IRR", f"{proj.st_irr:,.2f}%")
+    with col2:
+        st.metric("LTR NPV", f"£{proj.lt_npv:,.0f}")
+        st.metric("STR NPV", f"£{proj.st_npv:,.0f}")
+    with col3:
+        st.metric(f"Equity after {proj_years} yrs", f"£{proj.equity[-1]:,.0f}")
+        st.metric("Net sale proceeds", f"£{proj.sale_proceeds:,.0f}")
+
+    st.altair_chart(projection_chart(proj.yearly("lt_cash"), proj.yearly("st_cash"), proj.equity[11::12]),
+                    use_container_width=True)
+    with st.expander("Amortization schedule (yearly)"):
+        st.dataframe({
+            "Year": np.arange(1, proj_years + 1),
+            "Mortgage paid (£)": proj.yearly("payment"),
+            "Interest (£)": proj.yearly("interest"),
+            "Principal (£)": proj.yearly("principal"),
+            "Balance at year end (£)": proj.balance[11::12],
+            "Property value (£)": proj.value[11::12],
+            "Equity (£)": proj.equity[11::12],
+        }, use_container_width=True)
+
+# ---------------------------- Scenarios ----------------------------
+with tab7:
+    st.subheader("Saved scenarios")
+    st.caption(f"Saved to `{deal_store().path}` so they survive restarts.")
+    if "scenarios" not in st.session_state:
+        st.session_state.scenarios = deal_store().load()
+    store = st.session_state.scenarios
+
+    with st.form("save_scenario"):
+        colA, colB = st.columns([3, 1])
+        with colA:
+            scenario_name = st.text_input("Name", value=f"£{price:,.0f} property")
+        with colB:
+            scenario_postcode = st.text_input("Postcode (optional)")
+        st.caption("Optionally save one scenario per mortgage option (empty = current sidebar setting).")
+        colA, colB, colC = st.columns(3)
+        with colA:
+            variant_rates = st.text_input("Rates (%, comma-separated)", placeholder="4.5, 5, 5.5")
+        with colB:
+            variant_terms = st.multiselect("Terms (years)", [10, 15, 20, 25, 30, 35, 40])
+        with colC:
+            variant_types = st.multiselect("Types", ["Repayment", "Interest-only"])
+        if st.form_submit_button("Save current inputs"):
+            try:
+                rates = [float(r) for r in variant_rates.replace(";", ",").split(",") if r.strip()]
+            except ValueError:
+                st.error("Rates must be numbers, e.g. 4.5, 5, 5.5")
+            else:
+                variants = mortgage_variants(purchase_inputs, rates, variant_terms,
+                                             [t == "Interest-only" for t in variant_types])
+                saved = ScenarioStore()
+                for label, variant in variants:
+                    name = scenario_name if len(variants) == 1 else f"{scenario_name} · {label}"
+                    store.add(name, variant, ltr_inputs, str_inputs)
+                    saved.add(name, variant, ltr_inputs, str_inputs)
+                deal_store().save_scenarios(saved, [scenario_postcode or None] * len(saved))
+
+    if not len(store):
+        st.info("No scenarios saved yet: set up a deal and save it above.")
+    else:
+        comparison = scenario_comparison(tuple(store.names), store.columns)
+        st.dataframe(comparison, use_container_width=True)
+        compare_metric = st.selectbox("Chart metric", ["Annual cashflow (£)", "Monthly cashflow (£)", "Cash-on-cash (%)", "Net yield (%)"])
+        st.altair_chart(scenario_chart(comparison, compare_metric), use_container_width=True)
+        colA, colB = st.columns([3, 1])
+        with colA:
+            to_remove = st.multiselect("Remove scenarios", store.names)
+        with colB:
+            if st.button("Remove", disabled=not to_remove):
+                store.remove(to_remove)
+                deal_store().delete(to_remove)
+                st.rerun()
+        st.download_button("Download comparison (CSV)", to_csv(comparison), file_name="scenarios.csv", mime="text/csv")
 
 st.markdown("---")
 st.caption("NOTE: Cleaning cost = (365 × occupancy% ÷ average stay) × cost per clean. Example: 50% × 365 ÷ 2 × £60 = £5,475/yr (≈ £456/mo). If you expected £3,650/yr at 50%/£60/2 nights, that corresponds to an average stay of ~3 nights.")
@@ -0,0 +1,55 @@
+"""
+Benchmark: batch.py scaling with --workers (rows/sec and speedup over one worker).
+
+    python benchmarks/bench_batch_workers.py [--rows 2000000] [--workers 1 2 4 8 16 32]
+
+Writes a synthetic deals CSV to a temp directory and evaluates it with batch.run_parallel, discarding the output.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from batch import run_parallel  # noqa: E402
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=[w for w in (1, 2, 4, 8, 16, 32) if w <= cpus] or [1])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    n = args.rows
+    deals = pd.DataFrame({
+        "price": rng.uniform(5e4, 2e6, n).round(0),
+        "rate": rng.uniform(2, 8, n).round(2),
+        "monthly_rent": rng.uniform(500, 4000, n).round(0),
+        "nightly": rng.uniform(50, 300, n).round(0),
+        "occupancy": rng.uniform(20, 90, n).round(1),
+    })
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "deals.csv")
+        deals.to_csv(path, index=False)
+        print(f"{n:,} rows, {cpus} CPUs")
+        print(f"{'workers':>7} {'seconds':>9} {'rows/s':>12} {'speedup':>8}")
+        base = None
+        for w in args.workers:
+            with open(os.devnull, "w") as sink:
+                t0 = time.perf_counter()
+                run_parallel(path, sink, "csv", "csv", w, args.chunksize, progress=None)
+                elapsed = time.perf_counter() - t0
+            base = base or elapsed
+            print(f"{w:>7} {elapsed:>9.2f} {n / elapsed:>12,.0f} {base / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: single-input what-if sweeps over a portfolio, full `evaluate_columns` reruns vs `graph.sweep`
+(which recomputes only the nodes downstream of the swept input).
+
+    python benchmarks/bench_graph.py [n_deals]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from calc import evaluate_columns  # noqa: E402
+from graph import DealGraph, DOWNSTREAM, sweep  # noqa: E402
+
+OUTPUTS = ["lt_coc", "st_coc", "st_cash_yr"]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    columns = {
+        "price": rng.uniform(80_000, 1_000_000, n),
+        "rate": rng.uniform(3, 7, n),
+        "term": rng.integers(15, 36, n).astype(float),
+        "monthly_rent": rng.uniform(500, 3_000, n),
+        "nightly": rng.uniform(50, 300, n),
+        "occupancy": rng.uniform(30, 90, n),
+    }
+    graph = DealGraph.from_columns(columns)
+
+    print(f"{n:,} deals, 10 values per sweep")
+    print(f"{'input':<16} {'nodes redone':>12} {'full (s)':>10} {'graph (s)':>10} {'speedup':>9}")
+    for name, values in (
+        ("cost_per_clean", np.linspace(30, 90, 10)),
+        ("monthly_rent", [columns["monthly_rent"] * f for f in np.linspace(0.9, 1.1, 10)]),
+        ("rate", np.linspace(3, 7, 10)),
+    ):
+        t0 = time.perf_counter()
+        # Keep only the compared outputs of each full rerun, so 1M deals fit in a few GB.
+        full = [{out: r[out] for out in OUTPUTS}
+                for r in (evaluate_columns({**columns, name: np.broadcast_to(v, (n,))}) for v in values)]
+        t_full = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        swept = sweep(graph, name, values, OUTPUTS)
+        t_graph = time.perf_counter() - t0
+        for out in OUTPUTS:
+            assert np.array_equal(swept[out], np.stack([f[out] for f in full]))
+        print(f"{name:<16} {len(DOWNSTREAM[name]):>12} {t_full:>10.3f} {t_graph:>10.3f} {t_full / t_graph:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
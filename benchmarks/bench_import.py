@@ -0,0 +1,67 @@
+"""
+Cold-start import cost of the calculation core vs the full UI stack, from `python -X importtime`.
+
+    python benchmarks/bench_import.py [--repeat 5]
+
+Each target is imported in a fresh interpreter; the figure is the sum of top-level cumulative import
+times (best of --repeat runs), plus the wall time of the whole process.
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def app_imports() -> str:
+    """app.py's own top-level import statements, so the UI target follows whatever the app imports."""
+    with open(os.path.join(ROOT, "app.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+TARGETS = {
+    "calc core": "import calc",
+    "cli": "import cli",
+    "analysis modules": "import calc, sensitivity, montecarlo, projection, seasonal",
+    "batch (pandas)": "import batch",
+    "app.py imports": app_imports(),
+    # pandas and altair are imported lazily but still load on the first render (see app.py).
+    "full UI stack": app_imports() + "\nimport pandas, altair",
+}
+
+
+def import_time_us(stderr: str) -> int:
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):  # top-level imports only
+            total += int(cumulative)
+    return total
+
+
+def measure(code: str) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - t0
+    return import_time_us(proc.stderr) / 1000.0, wall * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(f"{'target':<18} {'imports (ms)':>13} {'process (ms)':>13}")
+    for label, code in TARGETS.items():
+        runs = [measure(code) for _ in range(args.repeat)]
+        print(f"{label:<18} {min(r[0] for r in runs):>13.1f} {min(r[1] for r in runs):>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: per-call stamp duty latency, the original band loop vs the compiled schedules the app, batch and server
+use (`stampduty.stamp_duty` -> `Regime.table()` -> `TaxTable`, bands from stamp_duty_bands.json).
+
+Scalar path: the loop (bands list rebuilt and walked per call) vs `TaxTable.tax_one` (one bisect + one
+multiply-add) and `stamp_duty(price, "england")` (regime lookup + the same). Array path: the loop over a list vs
+`stamp_duty(prices, "england")` (one searchsorted), from 1 price to 1M.
+
+    python benchmarks/bench_sdlt.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from stampduty import regime, stamp_duty  # noqa: E402
+
+EXEMPT_BELOW = 40_000  # the JSON tables' exemption, which the original loop predates
+
+
+def loop_sdlt(price: float) -> float:
+    """The original implementation, kept as the reference."""
+    bands = [(125000, 0.05), (250000, 0.07), (925000, 0.10), (1500000, 0.15), (float('inf'), 0.17)]
+    tax = 0.0
+    prev = 0.0
+    for t, rate in bands:
+        slice_amt = min(price, t) - prev
+        if slice_amt > 0:
+            tax += slice_amt * rate
+            prev = t
+        if price <= t:
+            break
+    return max(tax, 0.0)
+
+
+def reference(prices) -> list:
+    return [loop_sdlt(p) if p >= EXEMPT_BELOW else 0.0 for p in prices]
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def scalar():
+    prices = np.random.default_rng(0).uniform(0, 2_500_000, 100_000).tolist()
+    table = regime("england").table()
+    assert np.allclose(reference(prices), [stamp_duty(p, "england") for p in prices])
+    print(f"{'scalar path':<32} {'ns/call':>9}")
+    for label, fn in (
+        ("band loop", loop_sdlt),
+        ("TaxTable.tax_one (bisect)", table.tax_one),
+        ("stamp_duty(price, 'england')", stamp_duty),
+    ):
+        t = _best_of(lambda: [fn(p) for p in prices], 5)
+        print(f"{label:<32} {t / len(prices) * 1e9:>9.0f}")
+
+
+def array():
+    rng = np.random.default_rng(0)
+    print(f"\n{'array path n':>12} {'loop (s)':>12} {'array (s)':>12} {'speedup':>9}")
+    for n in (1, 100, 1_000, 10_000, 100_000, 1_000_000):
+        prices = rng.uniform(0, 2_500_000, n)
+        price_list = prices.tolist()
+        assert np.allclose(reference(price_list), stamp_duty(prices, "england"))
+        repeat = 1 if n >= 100_000 else 5 if n >= 1_000 else 200
+        t_loop = _best_of(lambda: [loop_sdlt(p) for p in price_list], repeat)
+        t_array = _best_of(lambda: stamp_duty(prices, "england"), repeat)
+        print(f"{n:>12,} {t_loop:>12.6f} {t_array:>12.6f} {t_loop / t_array:>8.1f}x")
+
+
+if __name__ == "__main__":
+    scalar()
+    array()
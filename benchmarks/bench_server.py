@@ -0,0 +1,59 @@
+"""
+Benchmark: deals/sec through the ASGI app in-process (JSON decode + evaluation + JSON encode, no sockets).
+
+    python benchmarks/bench_server.py
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from server import app  # noqa: E402
+
+
+async def call(method: str, path: str, body: bytes) -> bytes:
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app({"type": "http", "method": method, "path": path}, receive, send)
+    assert sent[0]["status"] == 200, sent
+    return sent[1]["body"]
+
+
+def deals(n: int, rng: np.random.Generator) -> list[dict]:
+    return [{"price": p, "rate": r, "monthly_rent": m, "nightly": ni, "occupancy": o}
+            for p, r, m, ni, o in zip(rng.uniform(5e4, 2e6, n).tolist(), rng.uniform(2, 8, n).tolist(),
+                                      rng.uniform(500, 4000, n).tolist(), rng.uniform(50, 300, n).tolist(),
+                                      rng.uniform(20, 90, n).tolist())]
+
+
+async def main():
+    rng = np.random.default_rng(0)
+    one = json.dumps(deals(1, rng)[0]).encode()
+    n_single = 5_000
+    t0 = time.perf_counter()
+    for _ in range(n_single):
+        await call("POST", "/evaluate", one)
+    print(f"{'POST /evaluate':<28} {n_single / (time.perf_counter() - t0):>12,.0f} deals/s")
+
+    for size in (100, 1_000, 10_000, 100_000):
+        body = json.dumps({"deals": deals(size, rng)}).encode()
+        repeat = max(1, 200_000 // size)
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            await call("POST", "/evaluate/batch", body)
+        rate = size * repeat / (time.perf_counter() - t0)
+        print(f"{f'POST /evaluate/batch ({size:,})':<28} {rate:>12,.0f} deals/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,51 @@
+"""
+Benchmark: bulk upsert into the SQLite DealStore and indexed screening queries over it.
+
+    python benchmarks/bench_store.py [n_deals]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from calc import LtrInputs, PurchaseInputs, StrInputs  # noqa: E402
+from scenarios import ScenarioStore  # noqa: E402
+from store import DealStore  # noqa: E402
+
+
+def _timed(label: str, fn):
+    t0 = time.perf_counter()
+    out = fn()
+    print(f"{label:<44} {time.perf_counter() - t0:>9.4f} s")
+    return out
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    template = ScenarioStore()
+    template.add("template", PurchaseInputs(), LtrInputs(), StrInputs())
+    columns = {k: np.repeat(v, n) for k, v in template.columns.items()}
+    columns["price"] = rng.uniform(80_000, 1_000_000, n)
+    columns["monthly_rent"] = rng.uniform(500, 3_000, n)
+    columns["nightly"] = rng.uniform(50, 300, n)
+    names = [f"deal-{i}" for i in range(n)]
+    areas = rng.choice(["SW", "M", "B", "LS", "EH"], n)
+    postcodes = [f"{a}{d} {s}AA" for a, d, s in zip(areas, rng.integers(1, 20, n), rng.integers(1, 9, n))]
+
+    with tempfile.TemporaryDirectory() as tmp, DealStore(os.path.join(tmp, "deals.sqlite")) as store:
+        _timed(f"insert {n:,} deals", lambda: store.save(names, columns, postcodes))
+        _timed("upsert same deals (rent +5%)", lambda: store.save(
+            names, {**columns, "monthly_rent": columns["monthly_rent"] * 1.05}, postcodes))
+        top = _timed("top 100 STR deals by coc (coc > 10%)",
+                     lambda: store.query("STR", min_coc=10, order_by="st_coc", limit=100))
+        assert min(top["st_coc"]) >= 10
+        _timed("first 1,000 LTR deals with net yield > 5%", lambda: store.query("LTR", min_yield=5))
+        _timed("LS1 deals under £200k", lambda: store.query(postcode="LS1", max_price=200_000, limit=None))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+"""
+Calculation helpers for the Hitch Property Management Calculator.
+
+Kept free of Streamlit so the maths can be imported by batch jobs and benchmarks.
+The `evaluate_*` functions take plain floats for one deal, or NumPy arrays (one element per deal) for many.
+"""
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from stampduty import DEFAULT_REGION, stamp_duty
+
+# Bumped whenever a formula change alters results, so persisted results (see store.py) know to recompute.
+CALC_VERSION = 2
+
+# ---------------------------- Mortgage ----------------------------
+def monthly_mortgage_payment(principal: float, annual_rate: float, years: int, interest_only: bool) -> float:
+    r = annual_rate/100.0/12.0
+    n = years*12
+    if principal <= 0 or annual_rate < 0 or years <= 0:
+        return 0.0
+    if interest_only:
+        return principal * r
+    if r == 0:
+        return principal / n
+    return principal * (r * (1 + r) ** n) / ((1 + r) ** n - 1)
+
+
+def monthly_mortgage_payment_array(principal, annual_rate, years, interest_only=False) -> np.ndarray:
+    """
+    Vectorized `monthly_mortgage_payment`. All arguments broadcast against each other, so a
+    rate × term × principal grid can be priced in one call (e.g. rates[:, None, None], terms[None, :, None]).
+    Invalid inputs (principal <= 0, rate < 0, term <= 0) give 0; a zero rate repays principal / n.
+    """
+    principal, annual_rate, years, interest_only = np.broadcast_arrays(
+        np.asarray(principal, dtype=float),
+        np.asarray(annual_rate, dtype=float),
+        np.asarray(years, dtype=float),
+        np.asarray(interest_only, dtype=bool),
+    )
+    r = annual_rate / 100.0 / 12.0
+    n = years * 12
+    valid = (principal > 0) & (annual_rate >= 0) & (years > 0)
+    amortizing = valid & ~interest_only
+    zero_rate = amortizing & (r == 0)
+    positive_rate = amortizing & (r > 0)
+
+    out = np.zeros(principal.shape)
+    out = np.where(valid & interest_only, principal * r, out)
+    out = np.where(zero_rate, principal / np.where(zero_rate, n, 1.0), out)
+    # r / (1 - (1 + r)^-n) is the annuity factor r(1+r)^n / ((1+r)^n - 1), without overflow for long terms.
+    r_safe = np.where(positive_rate, r, 1.0)
+    n_safe = np.where(positive_rate, n, 1.0)
+    factor = r_safe / -np.expm1(-n_safe * np.log1p(r_safe))
+    return np.where(positive_rate, principal * factor, out)
+
+
+# ---------------------------- Inputs & results ----------------------------
+# Field names and defaults match the app's sidebar and tab widgets.
+@dataclass(frozen=True)
+class PurchaseInputs:
+    price: float = 200000.0
+    deposit_pct: float = 25.0
+    interest_only: bool = False
+    rate: float = 5.0
+    term: int = 25
+    sdlt: float | None = None  # None (or NaN in arrays) = auto-calc stamp duty for `region`
+    region: str = DEFAULT_REGION  # "england" (SDLT, also NI), "scotland" (LBTT + ADS) or "wales" (LTT)
+    legal: float = 1500.0
+    broker: float = 500.0
+    survey: float = 400.0
+    refurb: float = 0.0
+    other_oa: float = 0.0
+
+
+@dataclass(frozen=True)
+class PurchaseResult:
+    price: float
+    deposit: float
+    loan: float
+    monthly_payment: float
+    sdlt: float
+    upfront_cash: float
+
+
+@dataclass(frozen=True)
+class LtrInputs:
+    monthly_rent: float = 1000.0
+    voids_pct: float = 5.0
+    mgmt_pct_lt: float = 10.0
+    maint_pct_lt: float = 5.0
+    service_chg: float = 0.0
+    ground_rent: float = 0.0
+    insurance: float = 250.0
+    letting_fees: float = 0.0
+    other_mo: float = 0.0
+
+
+@dataclass(frozen=True)
+class LtrResult:
+    revenue_mo: float
+    revenue_yr: float
+    opex_mo: float
+    opex_yr: float
+    noi_mo: float
+    noi_yr: float
+    mort_mo: float
+    mort_yr: float
+    cash_mo: float
+    cash_yr: float
+    gross_yield: float
+    net_yield: float
+    coc: float
+
+
+@dataclass(frozen=True)
+class StrInputs:
+    nightly: float = 120.0
+    occupancy: float = 60.0
+    avg_stay: int = 2
+    cost_per_clean: float = 50.0
+    mgmt_pct_str: float = 0.0
+    platform_pct: float = 5.0
+    utilities_mo: float = 250.0
+    rates_annual: float = 0.0
+
+
+@dataclass(frozen=True)
+class StrResult:
+    nights_year: float
+    stays_year: float
+    cleaning_year: float
+    cleaning_mo: float
+    revenue_mo: float
+    revenue_yr: float
+    opex_mo: float
+    opex_yr: float
+    noi_mo: float
+    noi_yr: float
+    mort_mo: float
+    mort_yr: float
+    cash_mo: float
+    cash_yr: float
+    gross_yield: float
+    net_yield: float
+    coc: float
+
+
+# Every input field in (purchase, LTR, STR) order, with its app default; the one list the other entry points use.
+INPUT_CLASSES = (PurchaseInputs, LtrInputs, StrInputs)
+INPUT_DEFAULTS = {f.name: f.default for cls in INPUT_CLASSES for f in fields(cls)}
+
+
+def is_array(*values) -> bool:
+    return any(isinstance(v, np.ndarray) for v in values)
+
+
+def clip0(x):
+    return np.maximum(x, 0.0) if is_array(x) else max(x, 0.0)
+
+
+def pct(num, den, ok):
+    """num / den × 100 where `ok`, else 0 (elementwise when `ok` is an array)."""
+    if is_array(ok):
+        return np.where(ok, num / np.where(ok, den, 1.0) * 100.0, 0.0)
+    return num / den * 100.0 if ok else num * 0.0
+
+
+# ---------------------------- Formulas ----------------------------
+def deposit_amount(price, deposit_pct):
+    return price * deposit_pct / 100.0
+
+
+def loan_amount(price, deposit):
+    return clip0(price - deposit)
+
+
+def mortgage_payment(loan, rate, term, interest_only):
+    if is_array(loan, rate, term, interest_only):
+        return monthly_mortgage_payment_array(loan, rate, term, interest_only)
+    return monthly_mortgage_payment(loan, rate, term, interest_only)
+
+
+def sdlt_due(price, sdlt, region):
+    """The manual figure, or auto-calculated stamp duty where it is None (NaN in arrays)."""
+    if sdlt is None or not is_array(price, sdlt, region):
+        return stamp_duty(price, region) if sdlt is None else sdlt
+    manual = np.asarray(sdlt, dtype=float)
+    return np.where(np.isnan(manual), stamp_duty(price, region), manual)
+
+
+def upfront_cash(deposit, sdlt, legal, broker, survey, refurb, other_oa):
+    return deposit + sdlt + legal + broker + survey + refurb + other_oa
+
+
+def ltr_opex_mo(monthly_rent, mgmt_pct_lt, maint_pct_lt, voids_pct, other_mo, service_chg, ground_rent, insurance,
+                letting_fees):
+    mgmt_mo = monthly_rent * mgmt_pct_lt / 100.0
+    maint_mo = monthly_rent * maint_pct_lt / 100.0
+    voids_mo = monthly_rent * voids_pct / 100.0
+    fixed_mo = other_mo + (service_chg + ground_rent + insurance + letting_fees) / 12.0
+    return mgmt_mo + maint_mo + voids_mo + fixed_mo
+
+
+def str_nights_year(occupancy):
+    return 365 * (occupancy / 100.0)
+
+
+def str_stays_year(nights_year, avg_stay):
+    return nights_year / avg_stay  # stays = nights / avg_stay
+
+
+def str_opex_year(revenue_year, mgmt_pct_str, platform_pct, cleaning_year, utilities_mo, rates_annual):
+    mgmt_year = revenue_year * mgmt_pct_str / 100.0
+    platform_year = revenue_year * platform_pct / 100.0
+    fixed_year = utilities_mo * 12 + rates_annual
+    return mgmt_year + platform_year + cleaning_year + fixed_year
+
+
+def same(x):
+    return x
+
+
+def product(a, b):
+    return a * b
+
+
+def net(a, b):
+    return a - b
+
+
+def annual(monthly):
+    return monthly * 12
+
+
+def monthly(annual_value):
+    return annual_value / 12.0
+
+
+def yield_pct(annual_value, price):
+    return pct(annual_value, price, price != 0)
+
+
+def cash_on_cash(annual_cash, upfront):
+    return pct(annual_cash, upfront, upfront > 0)
+
+
+# ---------------------------- Steps ----------------------------
+# (name, formula, dependencies), in evaluation order; dependencies are inputs or earlier steps. `evaluate_*` run
+# these and graph.py registers them as its nodes, so both share one definition of every figure.
+PURCHASE_STEPS = (
+    ("deposit", deposit_amount, ("price", "deposit_pct")),
+    ("loan", loan_amount, ("price", "deposit")),
+    ("monthly_payment", mortgage_payment, ("loan", "rate", "term", "interest_only")),
+    ("sdlt_due", sdlt_due, ("price", "sdlt", "region")),
+    ("upfront_cash", upfront_cash, ("deposit", "sdlt_due", "legal", "broker", "survey", "refurb", "other_oa")),
+)
+
+# Names are LtrResult / StrResult fields; price, monthly_payment and upfront_cash come from the purchase.
+LTR_STEPS = (
+    ("revenue_mo", same, ("monthly_rent",)),
+    ("revenue_yr", annual, ("revenue_mo",)),
+    ("opex_mo", ltr_opex_mo, ("monthly_rent", "mgmt_pct_lt", "maint_pct_lt", "voids_pct", "other_mo", "service_chg",
+                              "ground_rent", "insurance", "letting_fees")),
+    ("opex_yr", annual, ("opex_mo",)),
+    ("noi_mo", net, ("revenue_mo", "opex_mo")),
+    ("noi_yr", annual, ("noi_mo",)),
+    ("mort_mo", same, ("monthly_payment",)),
+    ("mort_yr", annual, ("mort_mo",)),
+    ("cash_mo", net, ("noi_mo", "mort_mo")),
+    ("cash_yr", annual, ("cash_mo",)),
+    ("gross_yield", yield_pct, ("revenue_yr", "price")),
+    ("net_yield", yield_pct, ("noi_yr", "price")),
+    ("coc", cash_on_cash, ("cash_yr", "upfront_cash")),
+)
+
+STR_STEPS = (
+    ("nights_year", str_nights_year, ("occupancy",)),
+    ("stays_year", str_stays_year, ("nights_year", "avg_stay")),
+    ("cleaning_year", product, ("cost_per_clean", "stays_year")),
+    ("cleaning_mo", monthly, ("cleaning_year",)),
+    ("revenue_yr", product, ("nightly", "nights_year")),
+    ("revenue_mo", monthly, ("revenue_yr",)),
+    ("opex_yr", str_opex_year, ("revenue_yr", "mgmt_pct_str", "platform_pct", "cleaning_year", "utilities_mo",
+                                "rates_annual")),
+    ("opex_mo", monthly, ("opex_yr",)),
+    ("noi_yr", net, ("revenue_yr", "opex_yr")),
+    ("noi_mo", monthly, ("noi_yr",)),
+    ("mort_mo", same, ("monthly_payment",)),
+    ("mort_yr", annual, ("mort_mo",)),
+    ("cash_mo", net, ("noi_mo", "mort_mo")),
+    ("cash_yr", annual, ("cash_mo",)),
+    ("gross_yield", yield_pct, ("revenue_yr", "price")),
+    ("net_yield", yield_pct, ("noi_yr", "price")),
+    ("coc", cash_on_cash, ("cash_yr", "upfront_cash")),
+)
+
+
+def run_steps(steps, values: dict) -> dict:
+    """Evaluate `steps` in order, adding each result to `values` (inputs by name)."""
+    for name, formula, deps in steps:
+        values[name] = formula(*[values[d] for d in deps])
+    return values
+
+
+# ---------------------------- Evaluation ----------------------------
+def evaluate_purchase(p: PurchaseInputs) -> PurchaseResult:
+    v = run_steps(PURCHASE_STEPS, vars(p).copy())
+    return PurchaseResult(p.price, v["deposit"], v["loan"], v["monthly_payment"], v["sdlt_due"], v["upfront_cash"])
+
+
+def evaluate_ltr(lt: LtrInputs, purchase: PurchaseResult) -> LtrResult:
+    v = run_steps(LTR_STEPS, {**vars(lt), "price": purchase.price, "monthly_payment": purchase.monthly_payment,
+                              "upfront_cash": purchase.upfront_cash})
+    return LtrResult(**{name: v[name] for name, _, _ in LTR_STEPS})
+
+
+def evaluate_str(s: StrInputs, purchase: PurchaseResult) -> StrResult:
+    v = run_steps(STR_STEPS, {**vars(s), "price": purchase.price, "monthly_payment": purchase.monthly_payment,
+                              "upfront_cash": purchase.upfront_cash})
+    return StrResult(**{name: v[name] for name, _, _ in STR_STEPS})
+
+
+@dataclass(frozen=True)
+class DealResult:
+    """Purchase plus both scenarios: the single source for the summary table, chart and exports."""
+    purchase: PurchaseResult
+    ltr: LtrResult
+    str_: StrResult
+
+    def summary(self) -> dict[str, list]:
+        rows = (self.ltr, self.str_)
+        return {
+            "Scenario": ["Long-term let", "Short-term let"],
+            "Monthly cashflow (£)": [r.cash_mo for r in rows],
+            "Annual cashflow (£)": [r.cash_yr for r in rows],
+            "Cash-on-cash (%)": [r.coc for r in rows],
+        }
+
+    def revenue_costs_profit(self, annual: bool = False) -> tuple[tuple, tuple]:
+        """(revenue, costs incl. mortgage, profit) for LTR and STR, per month or per year."""
+        if annual:
+            return tuple((r.revenue_yr, r.opex_yr + r.mort_yr, r.cash_yr) for r in (self.ltr, self.str_))
+        return tuple((r.revenue_mo, r.opex_mo + r.mort_mo, r.cash_mo) for r in (self.ltr, self.str_))
+
+
+def evaluate_deal(purchase: PurchaseInputs, ltr: LtrInputs, str_: StrInputs) -> DealResult:
+    result = evaluate_purchase(purchase)
+    return DealResult(result, evaluate_ltr(ltr, result), evaluate_str(str_, result))
+
+
+# ---------------------------- Columnar evaluation ----------------------------
+def deal_inputs(columns) -> tuple[PurchaseInputs, LtrInputs, StrInputs]:
+    """
+    Build the three input dataclasses from a mapping of column name -> values (dict of arrays, DataFrame, ...).
+    Column names are the dataclass field names; missing columns take the app defaults.
+    """
+    def build(cls):
+        kwargs = {}
+        for name in cls.__dataclass_fields__:
+            if name not in columns:
+                continue
+            values = np.asarray(columns[name])
+            if name == "region":
+                kwargs[name] = values.astype(str)
+            else:
+                kwargs[name] = values.astype(bool) if name == "interest_only" else values.astype(float)
+        return cls(**kwargs)
+
+    return build(PurchaseInputs), build(LtrInputs), build(StrInputs)
+
+
+def evaluate_columns(columns) -> dict[str, np.ndarray]:
+    """
+    Evaluate every deal in `columns` at once (see `deal_inputs`). Returns one array per metric:
+    purchase fields (deposit, loan, monthly_payment, sdlt, upfront_cash), then LTR metrics prefixed `lt_`
+    and STR metrics prefixed `st_`.
+    """
+    purchase_in, ltr_in, str_in = deal_inputs(columns)
+    n = len(columns[next(iter(columns))]) if len(columns) else 0
+    purchase = evaluate_purchase(purchase_in)
+    ltr = evaluate_ltr(ltr_in, purchase)
+    str_ = evaluate_str(str_in, purchase)
+
+    out = {}
+    for prefix, result in (("", purchase), ("lt_", ltr), ("st_", str_)):
+        for name, value in vars(result).items():
+            if prefix == "" and name == "price":
+                continue
+            out[prefix + name] = np.broadcast_to(np.asarray(value, dtype=float), (n,))
+    return out
@@ -0,0 +1,140 @@
+"""
+Headless command-line calculator: same inputs as the app's sidebar and tabs, no Streamlit.
+
+    python cli.py --price 250000 --monthly-rent 1200 --nightly 140 --format table
+    python cli.py --config deal.json --format csv --output deal.csv
+
+Inputs come from an optional JSON/YAML config (keys named like the app inputs, e.g. deposit_pct) and are
+overridden by flags. YAML needs PyYAML installed.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from dataclasses import fields
+
+from calc import INPUT_CLASSES, LtrInputs, PurchaseInputs, StrInputs, evaluate_deal
+from stampduty import regime
+
+
+def load_config(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("YAML config needs PyYAML (pip install pyyaml); or use JSON.")
+            return yaml.safe_load(f) or {}
+        return json.load(f)
+
+
+def region_name(value: str) -> str:
+    """A region name or alias (e.g. "NI", "Wales") as its regime name; unknown regions are a usage error."""
+    try:
+        return regime(value).name
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def integer(value) -> int:
+    number = float(value)
+    if not number.is_integer():
+        raise ValueError(f"not a whole number: {value!r}")
+    return int(number)
+
+
+def boolean(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text not in ("1", "0", "true", "false", "yes", "no"):
+        raise ValueError(f"not a boolean: {value!r}")
+    return text in ("1", "true", "yes")
+
+
+def field_type(f):
+    """Converter for an input field, shared by the flags and config values."""
+    if f.name == "region":
+        return region_name
+    if isinstance(f.default, bool):
+        return boolean
+    return integer if isinstance(f.default, int) else float
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Evaluate one deal as a long-term and short-term let.")
+    parser.add_argument("--config", help="JSON or YAML file of inputs (flags override it)")
+    parser.add_argument("--format", choices=["json", "csv", "table"], default="table")
+    parser.add_argument("--output", help="write here instead of stdout")
+    for cls in INPUT_CLASSES:
+        group = parser.add_argument_group(cls.__name__)
+        for f in fields(cls):
+            flag = "--" + f.name.replace("_", "-")
+            if isinstance(f.default, bool):
+                group.add_argument(flag, dest=f.name, action=argparse.BooleanOptionalAction, default=None,
+                                   help=f"default: {f.default}")
+            else:
+                group.add_argument(flag, dest=f.name, type=field_type(f), default=None,
+                                   help="default: auto" if f.default is None else f"default: {f.default}")
+    return parser
+
+
+def deal_from_args(args: argparse.Namespace) -> tuple[PurchaseInputs, LtrInputs, StrInputs]:
+    values = load_config(args.config) if args.config else {}
+    known = {f.name: f for cls in INPUT_CLASSES for f in fields(cls)}
+    unknown = set(values) - set(known)
+    if unknown:
+        raise SystemExit(f"Unknown inputs: {', '.join(sorted(unknown))}")
+    for name, value in values.items():
+        if value is not None:  # null = default (auto for sdlt)
+            try:
+                values[name] = field_type(known[name])(value)
+            except (TypeError, ValueError, argparse.ArgumentTypeError) as e:
+                raise SystemExit(f"Invalid {name} in config: {e}")
+    values = {k: v for k, v in values.items() if v is not None or k == "sdlt"}
+    values.update({k: v for k, v in vars(args).items() if v is not None and k in known})
+    if values.get("avg_stay", StrInputs.avg_stay) <= 0:
+        raise SystemExit("avg_stay must be at least 1 night")
+    return tuple(cls(**{f.name: values[f.name] for f in fields(cls) if f.name in values}) for cls in INPUT_CLASSES)
+
+
+def flat_results(deal) -> dict:
+    """Result columns named as in `calc.evaluate_columns` (purchase fields, lt_*, st_*)."""
+    out = {k: v for k, v in vars(deal.purchase).items() if k != "price"}
+    out.update({"lt_" + k: v for k, v in vars(deal.ltr).items()})
+    out.update({"st_" + k: v for k, v in vars(deal.str_).items()})
+    return out
+
+
+def render(deal, fmt: str) -> str:
+    if fmt == "json":
+        return json.dumps({"purchase": vars(deal.purchase), "ltr": vars(deal.ltr), "str": vars(deal.str_)}, indent=2)
+    if fmt == "csv":
+        row = flat_results(deal)
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(row.keys())
+        writer.writerow(row.values())
+        return buf.getvalue().rstrip("\n")
+    purchase = [f"{k:<16}{v:>14,.2f}" for k, v in vars(deal.purchase).items()]
+    rows = [f"{'metric':<16}{'LTR':>14}{'STR':>14}"]
+    for k, v in vars(deal.ltr).items():
+        rows.append(f"{k:<16}{v:>14,.2f}{getattr(deal.str_, k):>14,.2f}")
+    extra = [f"{k:<16}{'':>14}{v:>14,.2f}" for k, v in vars(deal.str_).items() if not hasattr(deal.ltr, k)]
+    return "\n".join(purchase + [""] + rows + extra)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    text = render(evaluate_deal(*deal_from_args(args)), args.format)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
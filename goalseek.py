@@ -0,0 +1,90 @@
+"""
+Goal seek: solve for one input that makes an output hit a target, e.g. the monthly_rent giving lt_cash_mo = 0,
+the occupancy giving st_coc = 8, or the largest price giving lt_net_yield = 6.
+
+Metrics use the `calc.evaluate_columns` names (upfront_cash, monthly_payment, lt_*, st_*). Where the metric is
+affine in the input (any LTR input → lt_* metric; any STR input except avg_stay → st_* metric) the answer is
+closed-form; otherwise it is found by vectorized bisection over a bracket. Inputs may hold arrays (one element
+per deal), in which case one solution per deal is returned; NaN means no solution in range.
+"""
+from dataclasses import fields, replace
+
+import numpy as np
+
+from calc import LtrInputs, PurchaseInputs, StrInputs, evaluate_ltr, evaluate_purchase, evaluate_str
+
+# Default search ranges for inputs solved by bisection.
+BRACKETS = {
+    "price": (1.0, 20_000_000.0),
+    "deposit_pct": (0.0, 100.0),
+    "rate": (0.0, 30.0),
+    "term": (1.0, 40.0),
+    "sdlt": (0.0, 5_000_000.0),
+    "legal": (0.0, 1_000_000.0),
+    "broker": (0.0, 1_000_000.0),
+    "survey": (0.0, 1_000_000.0),
+    "refurb": (0.0, 1_000_000.0),
+    "other_oa": (0.0, 1_000_000.0),
+    "avg_stay": (0.1, 365.0),
+}
+
+
+def metric_value(metric: str, purchase: PurchaseInputs, ltr: LtrInputs, str_: StrInputs):
+    result = evaluate_purchase(purchase)
+    if metric.startswith("lt_"):
+        return getattr(evaluate_ltr(ltr, result), metric[3:])
+    if metric.startswith("st_"):
+        return getattr(evaluate_str(str_, result), metric[3:])
+    return getattr(result, metric)
+
+
+def _with_input(name: str, value, purchase: PurchaseInputs, ltr: LtrInputs, str_: StrInputs):
+    out = []
+    for inputs in (purchase, ltr, str_):
+        out.append(replace(inputs, **{name: value}) if name in {f.name for f in fields(inputs)} else inputs)
+    return out
+
+
+def is_linear(metric: str, name: str) -> bool:
+    if metric.startswith("lt_"):
+        return name in {f.name for f in fields(LtrInputs)}
+    if metric.startswith("st_"):
+        return name in {f.name for f in fields(StrInputs)} and name != "avg_stay"
+    return False
+
+
+def goal_seek(metric: str, target, solve_for: str, purchase: PurchaseInputs = PurchaseInputs(),
+              ltr: LtrInputs = LtrInputs(), str_: StrInputs = StrInputs(), bracket: tuple | None = None,
+              iterations: int = 60):
+    """Value of `solve_for` at which `metric` equals `target` (which may also be an array)."""
+    if solve_for == "interest_only" or solve_for not in {f.name for cls in (PurchaseInputs, LtrInputs, StrInputs)
+                                                          for f in fields(cls)}:
+        raise ValueError(f"cannot solve for {solve_for!r}")
+
+    def f(x):
+        return np.asarray(metric_value(metric, *_with_input(solve_for, x, purchase, ltr, str_)), dtype=float) - target
+
+    if is_linear(metric, solve_for) and bracket is None:
+        f0 = f(np.float64(0.0))
+        slope = f(np.float64(1.0)) - f0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.where(slope != 0, -f0 / np.where(slope != 0, slope, 1.0), np.nan)
+        return x if x.ndim else float(x)
+
+    lo_v, hi_v = bracket or BRACKETS.get(solve_for, (0.0, 1_000_000.0))
+    f_lo = f(np.float64(lo_v))
+    shape = np.broadcast_shapes(f_lo.shape, f(np.float64(hi_v)).shape)
+    lo = np.full(shape, float(lo_v))
+    hi = np.full(shape, float(hi_v))
+    f_lo = np.broadcast_to(f_lo, shape)
+    f_hi = np.broadcast_to(f(hi), shape)
+    bracketed = np.sign(f_lo) * np.sign(f_hi) <= 0
+    for _ in range(iterations):
+        mid = (lo + hi) / 2.0
+        f_mid = f(mid)
+        same = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(same, mid, lo)
+        f_lo = np.where(same, f_mid, f_lo)
+        hi = np.where(same, hi, mid)
+    x = np.where(bracketed, (lo + hi) / 2.0, np.nan)
+    return x if x.ndim else float(x)
@@ -0,0 +1,176 @@
+"""
+The deal calculation as an explicit dependency graph: named inputs -> intermediates -> outputs.
+
+Every node is one of calc's evaluation steps (`calc.PURCHASE_STEPS`, `LTR_STEPS` as lt_*, `STR_STEPS` as st_*):
+a formula and the nodes (or inputs) it depends on. A `DealGraph` memoizes node values and, when an input
+changes, drops only the nodes downstream of it, so e.g. a new `cost_per_clean` recomputes the STR
+cleaning/opex/cashflow chain but not SDLT, the mortgage or any LTR figure.
+Works on plain floats (one deal) or NumPy arrays (a portfolio). `calc.evaluate_*` run the same steps, so the
+graph and every other entry point cannot drift apart.
+"""
+from dataclasses import asdict, fields
+
+import numpy as np
+
+from calc import (
+    INPUT_DEFAULTS, LTR_STEPS, PURCHASE_STEPS, STR_STEPS, DealResult, LtrInputs, LtrResult, PurchaseInputs,
+    PurchaseResult, StrInputs, StrResult, is_array,
+)
+
+# name -> (dependency names, formula)
+NODES: dict = {}
+
+
+def _register(steps, prefix: str = "") -> None:
+    """Add calc's evaluation steps as nodes, prefixing the step names (not the inputs) with `prefix`."""
+    names = {name for name, _, _ in steps}
+    for name, formula, deps in steps:
+        NODES[prefix + name] = (tuple(prefix + d if d in names else d for d in deps), formula)
+
+
+_register(PURCHASE_STEPS)
+_register(LTR_STEPS, "lt_")
+_register(STR_STEPS, "st_")
+
+
+def _downstream() -> dict[str, frozenset]:
+    """Input or node name -> every node that (transitively) depends on it."""
+    dependents = {name: set() for name in [*INPUT_DEFAULTS, *NODES]}
+    for name, (deps, _) in NODES.items():
+        for dep in deps:
+            dependents[dep].add(name)
+    closure = {}
+
+    def visit(name):
+        if name not in closure:
+            out = set(dependents[name])
+            for child in dependents[name]:
+                out |= visit(child)
+            closure[name] = frozenset(out)
+        return closure[name]
+
+    return {name: visit(name) for name in dependents}
+
+
+DOWNSTREAM = _downstream()
+
+
+def upstream(names) -> set:
+    """Every node the given nodes (transitively) depend on, including themselves."""
+    out, todo = set(), [n for n in names if n in NODES]
+    while todo:
+        name = todo.pop()
+        if name not in out:
+            out.add(name)
+            todo += [dep for dep in NODES[name][0] if dep in NODES]
+    return out
+
+
+def _same(a, b) -> bool:
+    if a is b:
+        return True
+    if is_array(a, b):
+        a, b = np.asarray(a), np.asarray(b)
+        return a.shape == b.shape and a.dtype == b.dtype and np.array_equal(a, b, equal_nan=a.dtype.kind == "f")
+    return a == b
+
+
+class DealGraph:
+    """Memoized evaluation of one deal (or one array of deals); `update` recomputes only what an input affects."""
+
+    def __init__(self, **inputs):
+        unknown = set(inputs) - set(INPUT_DEFAULTS)
+        if unknown:
+            raise KeyError(f"unknown inputs: {', '.join(sorted(unknown))}")
+        self.inputs = {**INPUT_DEFAULTS, **{k: _normalise(k, v) for k, v in inputs.items()}}
+        self.values: dict = {}
+        self.evaluations = 0  # formulas run so far, for profiling
+
+    @classmethod
+    def from_inputs(cls, purchase: PurchaseInputs, ltr: LtrInputs, str_: StrInputs) -> "DealGraph":
+        return cls(**asdict(purchase), **asdict(ltr), **asdict(str_))
+
+    @classmethod
+    def from_columns(cls, columns) -> "DealGraph":
+        """One array per input field (dict of arrays, DataFrame, ...); missing columns take the app defaults."""
+        return cls(**{name: columns[name] for name in INPUT_DEFAULTS if name in columns})
+
+    def update(self, **changes) -> frozenset:
+        """Set inputs, forgetting only the nodes downstream of those that actually changed. Returns those nodes."""
+        stale = set()
+        for name, value in changes.items():
+            if name not in INPUT_DEFAULTS:
+                raise KeyError(f"unknown input: {name}")
+            value = _normalise(name, value)
+            if not _same(self.inputs[name], value):
+                self.inputs[name] = value
+                stale |= DOWNSTREAM[name]
+        for name in stale:
+            self.values.pop(name, None)
+        return frozenset(stale)
+
+    def with_inputs(self, **changes) -> "DealGraph":
+        """A what-if copy with `changes` applied, sharing every memoized value they do not affect."""
+        other = DealGraph.__new__(DealGraph)
+        other.inputs, other.values, other.evaluations = dict(self.inputs), dict(self.values), 0
+        other.update(**changes)
+        return other
+
+    def __getitem__(self, name: str):
+        if name in self.inputs:
+            return self.inputs[name]
+        if name not in self.values:
+            deps, formula = NODES[name]
+            self.values[name] = formula(*(self[dep] for dep in deps))
+            self.evaluations += 1
+        return self.values[name]
+
+    def __len__(self) -> int:
+        """Number of deals (1 when every input is a scalar)."""
+        sizes = [np.size(v) for v in self.inputs.values() if isinstance(v, np.ndarray)]
+        return max(sizes, default=1)
+
+    # ---------------------------- Results ----------------------------
+    def purchase(self) -> PurchaseResult:
+        return PurchaseResult(self["price"], self["deposit"], self["loan"], self["monthly_payment"],
+                              self["sdlt_due"], self["upfront_cash"])
+
+    def ltr(self) -> LtrResult:
+        return LtrResult(**{f.name: self["lt_" + f.name] for f in fields(LtrResult)})
+
+    def str_(self) -> StrResult:
+        return StrResult(**{f.name: self["st_" + f.name] for f in fields(StrResult)})
+
+    def deal(self) -> DealResult:
+        return DealResult(self.purchase(), self.ltr(), self.str_())
+
+    def results(self, names=None) -> dict[str, np.ndarray]:
+        """Output arrays keyed like `calc.evaluate_columns` (all of them, or just `names`)."""
+        if names is None:
+            names = ["deposit", "loan", "monthly_payment", "sdlt", "upfront_cash"]
+            names += ["lt_" + f.name for f in fields(LtrResult)] + ["st_" + f.name for f in fields(StrResult)]
+        n = len(self)
+        return {
+            name: np.broadcast_to(np.asarray(self["sdlt_due" if name == "sdlt" else name], dtype=float), (n,))
+            for name in names
+        }
+
+
+def _normalise(name: str, value):
+    if isinstance(value, np.ndarray) or (not np.isscalar(value) and value is not None):
+        if name == "region":
+            return np.asarray(value).astype(str)
+        return np.asarray(value, dtype=bool if name == "interest_only" else float)
+    return value
+
+
+def sweep(graph: DealGraph, name: str, values, outputs) -> dict[str, np.ndarray]:
+    """
+    What-if sweep of one input over `values`: output -> array of shape (len(values), n_deals).
+    Only the nodes downstream of `name` are recomputed per value; everything else is evaluated once.
+    """
+    outputs = list(outputs)
+    for node in upstream("sdlt_due" if out == "sdlt" else out for out in outputs) - DOWNSTREAM[name]:
+        graph[node]  # evaluate the unaffected part once; every what-if copy shares it
+    runs = [graph.with_inputs(**{name: value}).results(outputs) for value in values]
+    return {out: np.stack([run[out] for run in runs]) for out in outputs}
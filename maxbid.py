@@ -0,0 +1,97 @@
+"""
+Maximum-bid calculator: the largest purchase price that fits a cash budget or meets a yield target.
+
+Upfront cash (deposit + SDLT + fees) and total acquisition cost (price + SDLT + fees) are piecewise-linear in
+price, with kinks at the stamp duty band thresholds (and a step at the £40k exemption). Both are inverted exactly, band by band, instead of by search:
+with a·price + SDLT(price) + c, find the band whose start value is the last one within budget and solve the
+linear piece inside it. All functions are vectorized over deals.
+"""
+from dataclasses import replace
+
+import numpy as np
+
+from calc import LtrInputs, PurchaseInputs, StrInputs, evaluate_ltr, evaluate_purchase, evaluate_str
+from stampduty import DEFAULT_REGION, TaxTable, regime
+
+
+def _invert_table(room: np.ndarray, slope: np.ndarray, table: TaxTable) -> np.ndarray:
+    # Cost at the start of each band, per deal: (..., bands).
+    at_threshold = slope[..., None] * table.thresholds + table.cumulative
+    band = np.clip((at_threshold <= room[..., None]).sum(axis=-1) - 1, 0, None)
+    start = np.take_along_axis(at_threshold, band[..., None], axis=-1)[..., 0]
+    with np.errstate(divide="ignore"):
+        p = table.thresholds[band] + (room - start) / (slope + table.rates[band])
+    # Where the tax steps up (the exemption), budgets in the gap stop just short of the next band.
+    band_end = np.append(table.thresholds[1:], np.inf)[band]
+    return np.where(p < band_end, p, np.nextafter(band_end, 0.0))
+
+
+def invert_price(budget, slope, const=0.0, auto_sdlt: bool = True, region=DEFAULT_REGION) -> np.ndarray:
+    """
+    Largest price p >= 0 with slope·p + stamp duty(p, region) + const <= budget (duty omitted when auto_sdlt is
+    False). NaN where even a price of 0 is over budget.
+    """
+    room = np.asarray(budget, dtype=float) - np.asarray(const, dtype=float)
+    slope = np.asarray(slope, dtype=float)
+    if not auto_sdlt:
+        with np.errstate(divide="ignore"):
+            p = np.where(slope > 0, room / np.where(slope > 0, slope, 1.0), np.inf)
+        return np.where(room >= 0, p, np.nan)
+    room, slope, region = np.broadcast_arrays(room, slope, np.asarray(region))
+    p = np.empty(room.shape)
+    for name in np.unique(region):
+        mask = region == name
+        p[mask] = _invert_table(room[mask], slope[mask], regime(name).table())
+    return np.where(room >= 0, p, np.nan)
+
+
+def _fees(purchase: PurchaseInputs):
+    return purchase.legal + purchase.broker + purchase.survey + purchase.refurb + purchase.other_oa
+
+
+def max_price_for_cash(cash_budget, purchase: PurchaseInputs = PurchaseInputs()) -> np.ndarray:
+    """Largest price whose upfront cash (deposit + SDLT + one-off costs) fits `cash_budget`."""
+    auto = purchase.sdlt is None
+    const = _fees(purchase) + (0.0 if auto else purchase.sdlt)
+    return invert_price(cash_budget, np.asarray(purchase.deposit_pct) / 100.0, const, auto_sdlt=auto,
+                        region=purchase.region)
+
+
+def max_price_for_yield(noi_yr, target_yield, basis: str = "price", purchase: PurchaseInputs = PurchaseInputs()) -> np.ndarray:
+    """
+    Largest price at which NOI / basis ≥ target_yield (%). basis="price" is the app's net yield;
+    basis="cost" divides by price + SDLT + one-off costs instead.
+    """
+    max_basis = np.asarray(noi_yr, dtype=float) * 100.0 / np.asarray(target_yield, dtype=float)
+    if basis == "price":
+        return np.where(max_basis >= 0, max_basis, np.nan)
+    if basis != "cost":
+        raise ValueError('basis must be "price" or "cost"')
+    auto = purchase.sdlt is None
+    const = _fees(purchase) + (0.0 if auto else purchase.sdlt)
+    return invert_price(max_basis, 1.0, const, auto_sdlt=auto, region=purchase.region)
+
+
+def max_offer(purchase: PurchaseInputs = PurchaseInputs(), ltr: LtrInputs = LtrInputs(), str_: StrInputs = StrInputs(),
+              cash_budget=None, target_yield=None, scenario: str = "ltr", basis: str = "price") -> np.ndarray:
+    """
+    Largest price meeting every given constraint: upfront cash within `cash_budget` and/or net yield of
+    `scenario` ("ltr" or "str") at least `target_yield` %. NOI does not depend on price, so it is taken from the
+    inputs as given.
+    """
+    if cash_budget is None and target_yield is None:
+        raise ValueError("give cash_budget and/or target_yield")
+    limits = []
+    if cash_budget is not None:
+        limits.append(max_price_for_cash(cash_budget, purchase))
+    if target_yield is not None:
+        result = evaluate_purchase(purchase)
+        noi = evaluate_ltr(ltr, result).noi_yr if scenario == "ltr" else evaluate_str(str_, result).noi_yr
+        limits.append(max_price_for_yield(noi, target_yield, basis, purchase))
+    out = limits[0] if len(limits) == 1 else np.minimum(*limits)  # NaN (infeasible) wins
+    return out if np.ndim(out) else float(out)
+
+
+def check_upfront(price, purchase: PurchaseInputs = PurchaseInputs()) -> np.ndarray:
+    """Upfront cash at `price` (for verifying a bid against the forward model)."""
+    return evaluate_purchase(replace(purchase, price=np.asarray(price, dtype=float))).upfront_cash
@@ -0,0 +1,124 @@
+"""
+Monte Carlo risk simulation for the LTR and STR scenarios.
+
+Uncertain inputs are drawn from configurable distributions and every path is evaluated at once through the
+array path of the calculation core. Large runs can be split across a process pool.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+
+import numpy as np
+
+from calc import LtrInputs, PurchaseInputs, StrInputs, evaluate_ltr, evaluate_purchase, evaluate_str
+
+
+# ---------------------------- Distributions ----------------------------
+@dataclass(frozen=True)
+class Normal:
+    mean: float
+    sd: float
+    low: float = -np.inf
+    high: float = np.inf
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return np.clip(rng.normal(self.mean, self.sd, n), self.low, self.high)
+
+
+@dataclass(frozen=True)
+class Uniform:
+    low: float
+    high: float
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.uniform(self.low, self.high, n)
+
+
+@dataclass(frozen=True)
+class Triangular:
+    low: float
+    mode: float
+    high: float
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        if self.low == self.high:
+            return np.full(n, float(self.low))
+        return rng.triangular(self.low, self.mode, self.high, n)
+
+
+# Inputs that may be given a distribution, e.g. {"rate": Normal(5.0, 1.0, low=0.0), "occupancy": Uniform(40, 80)}.
+UNCERTAIN_INPUTS = ("rate", "voids_pct", "maint_pct_lt", "occupancy", "nightly")
+
+
+# ---------------------------- Results ----------------------------
+@dataclass(frozen=True)
+class ScenarioStats:
+    cash_yr_p5: float
+    cash_yr_p50: float
+    cash_yr_p95: float
+    coc_p5: float
+    coc_p50: float
+    coc_p95: float
+    prob_negative: float  # share of paths with negative annual cashflow
+
+    @classmethod
+    def from_samples(cls, cash_yr: np.ndarray, coc: np.ndarray) -> "ScenarioStats":
+        c5, c50, c95 = np.percentile(cash_yr, [5, 50, 95]).tolist()
+        r5, r50, r95 = np.percentile(coc, [5, 50, 95]).tolist()
+        return cls(c5, c50, c95, r5, r50, r95, float(np.mean(cash_yr < 0)))
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    n: int
+    ltr: ScenarioStats
+    str_: ScenarioStats
+    samples: dict  # lt_cash_yr, lt_coc, st_cash_yr, st_coc -> (n,) arrays
+
+
+# ---------------------------- Simulation ----------------------------
+def _simulate_chunk(purchase: PurchaseInputs, ltr: LtrInputs, str_: StrInputs, dists: dict,
+                    n: int, seed: np.random.SeedSequence) -> dict:
+    rng = np.random.default_rng(seed)
+    drawn = {name: dist.sample(rng, n) for name, dist in dists.items()}
+
+    def with_draws(inputs):
+        names = {f.name for f in fields(inputs)}
+        return replace(inputs, **{k: v for k, v in drawn.items() if k in names})
+
+    purchase_res = evaluate_purchase(with_draws(purchase))
+    if not isinstance(purchase_res.monthly_payment, np.ndarray):
+        # No purchase-side draws: broadcast so results are per path.
+        purchase_res = replace(purchase_res, monthly_payment=np.full(n, purchase_res.monthly_payment))
+    lt = evaluate_ltr(with_draws(ltr), purchase_res)
+    st_ = evaluate_str(with_draws(str_), purchase_res)
+    return {"lt_cash_yr": lt.cash_yr, "lt_coc": lt.coc, "st_cash_yr": st_.cash_yr, "st_coc": st_.coc}
+
+
+def simulate(purchase: PurchaseInputs, ltr: LtrInputs, str_: StrInputs, dists: dict,
+             n: int = 100_000, seed: int | None = None, workers: int = 1) -> MonteCarloResult:
+    """
+    Run `n` paths. `dists` maps input names (see UNCERTAIN_INPUTS) to a distribution; other inputs stay fixed.
+    With workers > 1 the paths are split into one chunk per worker and run in a process pool.
+    """
+    unknown = set(dists) - set(UNCERTAIN_INPUTS)
+    if unknown:
+        raise ValueError(f"Unsupported uncertain inputs: {sorted(unknown)}")
+    if n <= 0:
+        raise ValueError("n must be positive")
+
+    workers = max(1, min(workers, n))
+    sizes = [n // workers + (i < n % workers) for i in range(workers)]
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    if workers == 1:
+        chunks = [_simulate_chunk(purchase, ltr, str_, dists, n, seeds[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_simulate_chunk, [purchase] * workers, [ltr] * workers, [str_] * workers,
+                                   [dists] * workers, sizes, seeds))
+    samples = {k: np.concatenate([c[k] for c in chunks]) for k in chunks[0]}
+    return MonteCarloResult(
+        n=n,
+        ltr=ScenarioStats.from_samples(samples["lt_cash_yr"], samples["lt_coc"]),
+        str_=ScenarioStats.from_samples(samples["st_cash_yr"], samples["st_coc"]),
+        samples=samples,
+    )
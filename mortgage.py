@@ -0,0 +1,187 @@
+"""
+Mortgage product comparison: fixed-rate periods that revert to a standard variable rate, with product fees.
+
+A product pays its initial rate for the fixed period (payments sized to clear the loan over the full term), then
+the payment is re-sized on the outstanding balance at the reversion rate. Each phase has a constant payment, so
+the balance after k months is closed-form and every figure is computed at once for products × deals; the
+month-by-month schedule is only built for display.
+"""
+import csv
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from calc import PurchaseInputs, evaluate_purchase, monthly_mortgage_payment_array
+
+
+@dataclass(frozen=True)
+class MortgageProduct:
+    name: str
+    initial_rate: float         # % APR during the fixed period
+    fixed_years: float          # 0 = variable from day one
+    reversion_rate: float       # % APR afterwards (lender's SVR)
+    fee: float = 0.0            # product / arrangement fee: £, or a share of the loan below 1 (0.03 = 3%)
+    fee_added: bool = False     # fee added to the loan instead of paid upfront
+
+
+# A few typical BTL offers, for the app's product table.
+SAMPLE_PRODUCTS = (
+    MortgageProduct("2y fixed, low fee", 4.79, 2, 7.99, 999),
+    MortgageProduct("2y fixed, 3% fee", 3.49, 2, 7.99, 0.03),
+    MortgageProduct("5y fixed", 4.99, 5, 7.99, 1999, fee_added=True),
+    MortgageProduct("5y fixed, no fee", 5.59, 5, 7.99, 0),
+    MortgageProduct("Tracker (base + 1.5%)", 5.75, 0, 5.75, 995),
+)
+
+
+@dataclass(frozen=True)
+class Products:
+    """Columnar product list: one array per MortgageProduct field."""
+    name: np.ndarray
+    initial_rate: np.ndarray
+    fixed_years: np.ndarray
+    reversion_rate: np.ndarray
+    fee: np.ndarray
+    fee_added: np.ndarray
+
+    @classmethod
+    def from_list(cls, products) -> "Products":
+        return cls.from_columns({f.name: [getattr(p, f.name) for p in products] for f in fields(MortgageProduct)})
+
+    @classmethod
+    def from_columns(cls, columns) -> "Products":
+        """From a mapping of field -> values (dict of lists, DataFrame, ...); fee/fee_added default to 0/False."""
+        n = len(columns["name"])
+        get = lambda name, default: np.asarray(columns[name]) if name in columns else np.full(n, default)  # noqa: E731
+        return cls(
+            name=np.asarray(columns["name"]).astype(str),
+            initial_rate=get("initial_rate", 0.0).astype(float),
+            fixed_years=get("fixed_years", 0.0).astype(float),
+            reversion_rate=get("reversion_rate", 0.0).astype(float),
+            fee=get("fee", 0.0).astype(float),
+            fee_added=get("fee_added", False).astype(bool),
+        )
+
+    @classmethod
+    def from_csv(cls, path: str) -> "Products":
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        columns = {k: [r[k] for r in rows] for k in (rows[0] if rows else {"name": None})}
+        if "fee_added" in columns:
+            columns["fee_added"] = [v.strip().lower() in ("1", "true", "yes", "y") for v in columns["fee_added"]]
+        return cls.from_columns(columns)
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+
+def product_fee(products: Products, loan) -> np.ndarray:
+    """Fees in £: values below 1 are read as a share of the loan (0.03 = 3%), as BTL lenders quote them."""
+    fee = products.fee[:, None]
+    return np.where(fee < 1.0, fee * np.asarray(loan, dtype=float), fee)
+
+
+def _balance_after(principal, annual_rate, payment, months):
+    """Outstanding balance after `months` constant payments (closed form; zero rate repays linearly)."""
+    r = np.asarray(annual_rate, dtype=float) / 1200.0
+    growth = np.exp(months * np.log1p(r))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        paid = np.where(r > 0, payment * np.expm1(months * np.log1p(r)) / np.where(r > 0, r, 1.0), payment * months)
+    return np.maximum(principal * growth - paid, 0.0)
+
+
+# ---------------------------- Comparison ----------------------------
+@dataclass(frozen=True)
+class ProductComparison:
+    """Every array is (products, deals)."""
+    names: np.ndarray
+    horizon_months: int
+    borrowed: np.ndarray          # loan incl. any fee added
+    upfront_fee: np.ndarray
+    initial_payment: np.ndarray   # monthly, during the fixed period
+    reversion_payment: np.ndarray  # monthly, after it (0 if the horizon ends first)
+    payments: np.ndarray          # total paid over the horizon
+    balance_end: np.ndarray       # outstanding at the end of the horizon
+    total_cost: np.ndarray        # interest + fees over the horizon: upfront fee + payments + balance_end - loan
+    rank: np.ndarray              # 0 = cheapest product for that deal
+
+    def best(self) -> np.ndarray:
+        """Index of the cheapest product per deal."""
+        return np.argmin(self.total_cost, axis=0)
+
+    def table(self, deal: int = 0) -> dict[str, list]:
+        """One deal's products, cheapest first."""
+        order = np.argsort(self.total_cost[:, deal], kind="stable")
+        col = lambda a: a[order, deal].tolist()  # noqa: E731
+        return {
+            "Rank": (self.rank[order, deal] + 1).tolist(),
+            "Product": self.names[order].tolist(),
+            "Initial payment (£/mo)": col(self.initial_payment),
+            "Reversion payment (£/mo)": col(self.reversion_payment),
+            "Upfront fee (£)": col(self.upfront_fee),
+            f"Cost over {self.horizon_months // 12}y (£)": col(self.total_cost),
+            "Balance at end (£)": col(self.balance_end),
+        }
+
+
+def compare_products(products: Products, purchase: PurchaseInputs = PurchaseInputs(),
+                     horizon_years: float = 5.0) -> ProductComparison:
+    """
+    Price every product against every deal in `purchase` (scalars or arrays) over `horizon_years`, using the
+    deal's loan, term and repayment type, and rank products per deal by total cost (interest + fees).
+    """
+    result = evaluate_purchase(purchase)
+    loan = np.atleast_1d(np.asarray(result.loan, dtype=float))[None, :]
+    term_months = np.atleast_1d(np.asarray(purchase.term, dtype=float))[None, :] * 12
+    interest_only = np.atleast_1d(np.asarray(purchase.interest_only, dtype=bool))[None, :]
+    horizon = int(round(horizon_years * 12))
+
+    fee = product_fee(products, loan)
+    added = products.fee_added[:, None]
+    borrowed = loan + np.where(added, fee, 0.0)
+    upfront_fee = np.where(added, 0.0, fee)
+    fixed = np.minimum(np.round(products.fixed_years[:, None] * 12), term_months)
+    initial_rate, reversion_rate = products.initial_rate[:, None], products.reversion_rate[:, None]
+
+    # Phase 1: initial rate for min(fixed period, horizon); payment sized over the full term.
+    k1 = np.minimum(fixed, horizon)
+    p1 = monthly_mortgage_payment_array(borrowed, initial_rate, term_months / 12, interest_only)
+    b1 = np.where(interest_only, borrowed, _balance_after(borrowed, initial_rate, p1, k1))
+    # Phase 2: reversion rate on what is left, re-sized over the remaining term, until the horizon or term end.
+    k2 = np.maximum(np.minimum(horizon, term_months) - k1, 0)
+    remaining_years = np.maximum(term_months - k1, 0) / 12
+    p2 = np.where(k2 > 0, monthly_mortgage_payment_array(b1, reversion_rate, remaining_years, interest_only), 0.0)
+    b2 = np.where(interest_only, b1, _balance_after(b1, reversion_rate, p2, k2))
+    # Interest-only loans are repaid at term end.
+    b2 = np.where(interest_only & (horizon >= term_months), 0.0, b2)
+    payments = p1 * k1 + p2 * k2 + np.where(interest_only & (horizon >= term_months), b1, 0.0)
+
+    total_cost = upfront_fee + payments + b2 - loan
+    rank = np.argsort(np.argsort(total_cost, axis=0, kind="stable"), axis=0)
+    return ProductComparison(products.name, horizon, borrowed, upfront_fee, p1, p2, payments, b2, total_cost, rank)
+
+
+def payment_schedule(product: MortgageProduct, loan: float, term_years: int, interest_only: bool = False,
+                     months: int | None = None) -> dict[str, np.ndarray]:
+    """Month-by-month schedule for one product and deal (month, rate, payment, interest, principal, balance)."""
+    n = int(round(term_years * 12))
+    months = n if months is None else min(int(months), n)
+    fee = product.fee * loan if product.fee < 1.0 else product.fee
+    balance = loan + (fee if product.fee_added else 0.0)
+    fixed = min(int(round(product.fixed_years * 12)), n)
+    out = {k: np.zeros(months) for k in ("rate", "payment", "interest", "principal", "balance")}
+    payment = 0.0
+    for m in range(months):
+        if m == 0 or m == fixed:
+            rate = product.initial_rate if m < fixed else product.reversion_rate
+            payment = float(monthly_mortgage_payment_array(balance, rate, (n - m) / 12, interest_only))
+        interest = balance * rate / 1200.0
+        principal = balance if interest_only and m == n - 1 else min(payment - interest, balance)
+        principal = 0.0 if interest_only and m < n - 1 else principal
+        balance -= principal
+        paid = interest + principal
+        for key, value in (("rate", rate), ("payment", paid), ("interest", interest), ("principal", principal),
+                           ("balance", balance)):
+            out[key][m] = value
+    out["month"] = np.arange(1, months + 1)
+    return out
@@ -0,0 +1,169 @@
+"""
+Multi-year projection: amortization schedule, rent growth, cost inflation, capital growth, equity and IRR/NPV.
+
+Everything is built as month arrays (last axis), so array inputs (one element per deal) project a whole
+portfolio at once: results then have shape (deals, months).
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from calc import LtrInputs, PurchaseInputs, PurchaseResult, StrInputs, evaluate_ltr, evaluate_str
+
+
+@dataclass(frozen=True)
+class ProjectionInputs:
+    years: int = 10             # holding period, 1–40
+    rent_growth: float = 3.0    # % a year, applied to rent/nightly revenue and the fees charged as % of it
+    cost_inflation: float = 3.0  # % a year, applied to fixed costs and cleaning
+    capital_growth: float = 3.0  # % a year, property value
+    discount_rate: float = 8.0  # % a year, for NPV
+    selling_costs_pct: float = 2.0  # % of sale price at the end of the holding period
+
+
+@dataclass(frozen=True)
+class Projection:
+    months: np.ndarray         # 1..N
+    payment: np.ndarray        # mortgage paid in the month (interest + principal, incl. any interest-only balloon)
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray        # loan outstanding at month end
+    value: np.ndarray          # property value at month end
+    equity: np.ndarray         # value - balance
+    lt_revenue: np.ndarray
+    lt_opex: np.ndarray
+    lt_cash: np.ndarray
+    st_revenue: np.ndarray
+    st_opex: np.ndarray
+    st_cash: np.ndarray
+    sale_proceeds: np.ndarray  # net of selling costs and loan redemption, received in the last month
+    lt_npv: np.ndarray
+    st_npv: np.ndarray
+    lt_irr: np.ndarray         # % a year, NaN if the cashflows never change sign
+    st_irr: np.ndarray
+
+    def yearly(self, name: str) -> np.ndarray:
+        """Sum a monthly series (e.g. "lt_cash") into years: shape (..., years)."""
+        x = getattr(self, name)
+        return x.reshape(x.shape[:-1] + (-1, 12)).sum(axis=-1)
+
+
+# ---------------------------- Amortization ----------------------------
+def amortization_schedule(principal, annual_rate, years, interest_only, months: int) -> dict[str, np.ndarray]:
+    """
+    Month-by-month loan schedule over `months` months (may be longer or shorter than the term).
+    Arguments broadcast like `monthly_mortgage_payment_array`; outputs have a trailing months axis.
+    Interest-only loans repay the balance in full in the term's last month. Invalid loans give zeros.
+    """
+    P = np.asarray(principal, dtype=float)[..., None]
+    rate = np.asarray(annual_rate, dtype=float)[..., None]
+    n = np.asarray(years, dtype=float)[..., None] * 12
+    io = np.asarray(interest_only, dtype=bool)[..., None]
+    k = np.arange(1, months + 1)
+    r = rate / 100.0 / 12.0
+    valid = (P > 0) & (rate >= 0) & (n > 0)
+
+    # Repayment balance after k payments: P(1+r)^k - pmt((1+r)^k - 1)/r, with pmt the annuity payment.
+    r_safe = np.where(r > 0, r, 1.0)
+    growth_m1 = np.expm1(k * np.log1p(r_safe))        # (1+r)^k - 1
+    annuity_m1 = np.expm1(n * np.log1p(r_safe))       # (1+r)^n - 1
+    repay_balance = P * (1.0 - growth_m1 / np.where(valid, annuity_m1, 1.0))
+    repay_balance = np.where(r > 0, repay_balance, P * (1.0 - k / np.where(valid, n, 1.0)))
+    balance = np.where(io, P, repay_balance)
+    balance = np.where(valid & (k < n), np.maximum(balance, 0.0), 0.0)
+
+    prev = np.concatenate([np.broadcast_to(np.where(valid, P, 0.0), balance.shape[:-1] + (1,)), balance[..., :-1]], axis=-1)
+    interest = np.where(k <= n, prev * r, 0.0)
+    principal_paid = prev - balance
+    return {"payment": interest + principal_paid, "interest": interest, "principal": principal_paid, "balance": balance}
+
+
+# ---------------------------- NPV / IRR ----------------------------
+def npv(annual_rate, cashflows) -> np.ndarray:
+    """NPV of monthly cashflows (month 0 first, last axis) at an annual rate in %."""
+    cashflows = np.asarray(cashflows, dtype=float)
+    monthly = (1.0 + np.asarray(annual_rate, dtype=float) / 100.0) ** (1.0 / 12.0) - 1.0
+    t = np.arange(cashflows.shape[-1])
+    return (cashflows * np.exp(-t * np.log1p(np.asarray(monthly)[..., None]))).sum(axis=-1)
+
+
+def irr(cashflows, low: float = -99.0, high: float = 1000.0, iterations: int = 50) -> np.ndarray:
+    """
+    Annual IRR (%) of monthly cashflows (month 0 first, last axis), by vectorized bisection on [low, high].
+    NaN where NPV does not change sign over the bracket.
+    """
+    cashflows = np.asarray(cashflows, dtype=float)
+    lo = np.full(cashflows.shape[:-1], low)
+    hi = np.full(cashflows.shape[:-1], high)
+    f_lo = npv(lo, cashflows)
+    bracketed = np.sign(f_lo) != np.sign(npv(hi, cashflows))
+    for _ in range(iterations):
+        mid = (lo + hi) / 2.0
+        f_mid = npv(mid, cashflows)
+        same = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(same, mid, lo)
+        f_lo = np.where(same, f_mid, f_lo)
+        hi = np.where(same, hi, mid)
+    return np.where(bracketed, (lo + hi) / 2.0, np.nan)
+
+
+# ---------------------------- Projection ----------------------------
+def project(purchase_in: PurchaseInputs, purchase: PurchaseResult, ltr_in: LtrInputs, str_in: StrInputs,
+            proj: ProjectionInputs = ProjectionInputs()) -> Projection:
+    months = int(proj.years) * 12
+    if not 1 <= proj.years <= 40:
+        raise ValueError("years must be between 1 and 40")
+    k = np.arange(1, months + 1)
+    year_idx = (k - 1) // 12
+    rent_f = (1.0 + proj.rent_growth / 100.0) ** year_idx
+    cost_f = (1.0 + proj.cost_inflation / 100.0) ** year_idx
+
+    loan = amortization_schedule(purchase.loan, purchase_in.rate, purchase_in.term, purchase_in.interest_only, months)
+    value = np.asarray(purchase.price, dtype=float)[..., None] * (1.0 + proj.capital_growth / 100.0) ** (k / 12.0)
+
+    # Split each scenario's opex into the part charged as % of revenue (grows with rent) and the rest (inflates).
+    ltr = evaluate_ltr(ltr_in, purchase)
+    lt_pct = (np.asarray(ltr_in.voids_pct) + ltr_in.mgmt_pct_lt + ltr_in.maint_pct_lt) / 100.0
+    lt_rev0 = np.asarray(ltr.revenue_mo, dtype=float)[..., None]
+    lt_fixed0 = np.asarray(ltr.opex_mo - ltr.revenue_mo * lt_pct, dtype=float)[..., None]
+    lt_revenue = lt_rev0 * rent_f
+    lt_opex = lt_revenue * np.asarray(lt_pct)[..., None] + lt_fixed0 * cost_f
+
+    str_ = evaluate_str(str_in, purchase)
+    st_pct = (np.asarray(str_in.mgmt_pct_str) + str_in.platform_pct) / 100.0
+    st_rev0 = np.asarray(str_.revenue_mo, dtype=float)[..., None]
+    st_fixed0 = np.asarray(str_.opex_mo - str_.revenue_mo * st_pct, dtype=float)[..., None]
+    st_revenue = st_rev0 * rent_f
+    st_opex = st_revenue * np.asarray(st_pct)[..., None] + st_fixed0 * cost_f
+
+    lt_cash = lt_revenue - lt_opex - loan["payment"]
+    st_cash = st_revenue - st_opex - loan["payment"]
+    sale = value[..., -1] * (1.0 - proj.selling_costs_pct / 100.0) - loan["balance"][..., -1]
+
+    def flows(cash):
+        out = np.concatenate([np.broadcast_to(-np.asarray(purchase.upfront_cash, dtype=float)[..., None],
+                                              cash.shape[:-1] + (1,)), cash], axis=-1)
+        out[..., -1] += sale
+        return out
+
+    lt_flows, st_flows = flows(lt_cash), flows(st_cash)
+    return Projection(
+        months=k,
+        payment=loan["payment"],
+        interest=loan["interest"],
+        principal=loan["principal"],
+        balance=loan["balance"],
+        value=value,
+        equity=value - loan["balance"],
+        lt_revenue=lt_revenue,
+        lt_opex=lt_opex,
+        lt_cash=lt_cash,
+        st_revenue=st_revenue,
+        st_opex=st_opex,
+        st_cash=st_cash,
+        sale_proceeds=sale,
+        lt_npv=npv(proj.discount_rate, lt_flows),
+        st_npv=npv(proj.discount_rate, st_flows),
+        lt_irr=irr(lt_flows),
+        st_irr=irr(st_flows),
+    )
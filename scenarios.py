@@ -0,0 +1,88 @@
+"""
+Scenario workspace: many named deals (properties × mortgage options) kept as one columnar store and evaluated
+in a single vectorized pass, with LTR and STR results side by side.
+"""
+from dataclasses import asdict, fields, replace
+
+import numpy as np
+
+from calc import INPUT_CLASSES, INPUT_DEFAULTS, LtrInputs, PurchaseInputs, StrInputs, evaluate_columns
+
+INPUT_FIELDS = list(INPUT_DEFAULTS)
+
+
+def column_dtype(name: str):
+    return {"interest_only": bool, "region": object}.get(name, float)
+
+
+class ScenarioStore:
+    """One NumPy array per input field, one row per named scenario (sdlt NaN = auto-calc)."""
+
+    def __init__(self):
+        self.names: list[str] = []
+        self.columns = {name: np.empty(0, dtype=column_dtype(name)) for name in INPUT_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str, purchase: PurchaseInputs, ltr: LtrInputs, str_: StrInputs) -> None:
+        """Append a scenario, or overwrite the one already saved under `name`."""
+        row = {**asdict(purchase), **asdict(ltr), **asdict(str_)}
+        if row["sdlt"] is None:
+            row["sdlt"] = np.nan
+        if name in self.names:
+            i = self.names.index(name)
+            for k, v in row.items():
+                self.columns[k][i] = v
+            return
+        self.names.append(name)
+        for k, v in row.items():
+            self.columns[k] = np.append(self.columns[k], v)
+
+    def remove(self, names) -> None:
+        keep = np.array([n not in set(names) for n in self.names], dtype=bool)
+        self.names = [n for n, k in zip(self.names, keep) if k]
+        self.columns = {k: v[keep] for k, v in self.columns.items()}
+
+    def inputs(self, name: str) -> tuple[PurchaseInputs, LtrInputs, StrInputs]:
+        i = self.names.index(name)
+        out = []
+        for cls in INPUT_CLASSES:
+            values = {f.name: self.columns[f.name][i:i + 1].tolist()[0] for f in fields(cls)}
+            values.update({f.name: int(values[f.name]) for f in fields(cls) if type(f.default) is int})
+            if cls is PurchaseInputs and np.isnan(values["sdlt"]):
+                values["sdlt"] = None
+            out.append(cls(**values))
+        return tuple(out)
+
+    def evaluate(self) -> dict[str, np.ndarray]:
+        return evaluate_columns(self.columns) if self.names else {}
+
+    def comparison(self) -> dict[str, list]:
+        """Long table: one row per scenario × letting strategy, from one evaluation of the whole store."""
+        results = self.evaluate()
+        out = {"Scenario": [], "Strategy": [], "Price (£)": [], "Upfront cash (£)": [], "Monthly cashflow (£)": [],
+               "Annual cashflow (£)": [], "Net yield (%)": [], "Cash-on-cash (%)": []}
+        if not self.names:
+            return out
+        for prefix, strategy in (("lt_", "LTR"), ("st_", "STR")):
+            out["Scenario"] += self.names
+            out["Strategy"] += [strategy] * len(self.names)
+            out["Price (£)"] += self.columns["price"].tolist()
+            out["Upfront cash (£)"] += results["upfront_cash"].tolist()
+            out["Monthly cashflow (£)"] += results[prefix + "cash_mo"].tolist()
+            out["Annual cashflow (£)"] += results[prefix + "cash_yr"].tolist()
+            out["Net yield (%)"] += results[prefix + "net_yield"].tolist()
+            out["Cash-on-cash (%)"] += results[prefix + "coc"].tolist()
+        return out
+
+
+def mortgage_variants(purchase: PurchaseInputs, rates=(), terms=(), interest_only=()) -> list[tuple[str, PurchaseInputs]]:
+    """(label suffix, inputs) for every rate × term × type combination; empty options keep the current value."""
+    variants = []
+    for r in rates or (purchase.rate,):
+        for t in terms or (purchase.term,):
+            for io in interest_only or (purchase.interest_only,):
+                label = f"{r:g}% {t:g}y {'IO' if io else 'repayment'}"
+                variants.append((label, replace(purchase, rate=float(r), term=int(t), interest_only=bool(io))))
+    return variants
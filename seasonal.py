@@ -0,0 +1,74 @@
+"""
+Seasonal STR revenue: per-month (12) or per-day (365) nightly rate and occupancy profiles.
+
+Profiles have the period on the last axis, so a (units, 365) calendar evaluates a whole batch of units at once.
+Annual totals come back as a regular `StrResult`, so yields and cash-on-cash match the flat model's definitions.
+"""
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from calc import PurchaseResult, StrInputs, StrResult, evaluate_str
+
+MONTH_DAYS = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+_MONTH_STARTS = np.concatenate(([0], np.cumsum(MONTH_DAYS)[:-1]))
+
+
+@dataclass(frozen=True)
+class SeasonalStr:
+    # (..., 12) monthly series
+    nights: np.ndarray
+    revenue: np.ndarray
+    cleaning: np.ndarray
+    opex: np.ndarray
+    noi: np.ndarray
+    cash: np.ndarray
+    annual: StrResult
+
+
+def _profile(values, default, daily: bool) -> np.ndarray:
+    """Profile on the requested period grid; None = flat at `default`."""
+    if values is None:
+        return np.asarray(default, dtype=float)[..., None]
+    p = np.asarray(values, dtype=float)
+    if p.shape[-1] not in (12, 365):
+        raise ValueError(f"profile must have 12 (monthly) or 365 (daily) entries, got {p.shape[-1]}")
+    if daily and p.shape[-1] == 12:
+        return np.repeat(p, MONTH_DAYS, axis=-1)
+    return p
+
+
+def seasonal_str(inputs: StrInputs, purchase: PurchaseResult, nightly=None, occupancy=None) -> SeasonalStr:
+    """
+    STR model with seasonal `nightly` (£) and/or `occupancy` (% of days) profiles; a missing profile is flat at
+    the value in `inputs`. Cleaning and % fees are computed per period, then rolled up to months.
+    """
+    daily = any(p is not None and np.shape(p)[-1] == 365 for p in (nightly, occupancy))
+    nightly_p = _profile(nightly, inputs.nightly, daily)
+    occ_p = _profile(occupancy, inputs.occupancy, daily)
+    days = 1.0 if daily else MONTH_DAYS
+
+    def col(x):
+        return np.asarray(x, dtype=float)[..., None]
+
+    nights = days * occ_p / 100.0
+    revenue = nightly_p * nights
+    cleaning = col(inputs.cost_per_clean) * nights / col(inputs.avg_stay)
+    if daily:
+        nights, revenue, cleaning = (np.add.reduceat(x, _MONTH_STARTS, axis=-1) for x in (nights, revenue, cleaning))
+    shape = np.broadcast_shapes(nights.shape, revenue.shape, cleaning.shape)
+    nights, revenue, cleaning = (np.broadcast_to(x, shape) for x in (nights, revenue, cleaning))
+
+    fees = revenue * col(np.asarray(inputs.mgmt_pct_str) + inputs.platform_pct) / 100.0
+    fixed = col(np.asarray(inputs.utilities_mo) + np.asarray(inputs.rates_annual) / 12.0)
+    opex = fees + cleaning + fixed
+    noi = revenue - opex
+    cash = noi - col(purchase.monthly_payment)
+
+    # Every annual STR metric is linear in nights and revenue, so the flat model evaluated at the
+    # year's effective occupancy and average nightly rate reproduces the seasonal totals exactly.
+    nights_year = nights.sum(axis=-1)
+    revenue_year = revenue.sum(axis=-1)
+    adr = np.divide(revenue_year, nights_year, out=np.zeros_like(revenue_year), where=nights_year > 0)
+    annual = evaluate_str(replace(inputs, occupancy=nights_year / 365.0 * 100.0, nightly=adr), purchase)
+    return SeasonalStr(nights, revenue, cleaning, opex, noi, cash, annual)
@@ -0,0 +1,26 @@
+"""
+STR sensitivity grid: annual cashflow and cash-on-cash over occupancy × nightly rate, in one vectorized pass.
+"""
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from calc import PurchaseResult, StrInputs, evaluate_str
+
+
+@dataclass(frozen=True)
+class StrGrid:
+    occupancy: np.ndarray  # (n_occ,) % of days
+    nightly: np.ndarray    # (n_nightly,) £
+    cash_yr: np.ndarray    # (n_occ, n_nightly) £
+    coc: np.ndarray        # (n_occ, n_nightly) %
+
+
+def str_sensitivity(inputs: StrInputs, purchase: PurchaseResult, occupancy, nightly) -> StrGrid:
+    """Evaluate `inputs` at every (occupancy, nightly) pair; all other STR inputs stay as given."""
+    occupancy = np.asarray(occupancy, dtype=float)
+    nightly = np.asarray(nightly, dtype=float)
+    grid_inputs = replace(inputs, occupancy=occupancy[:, None], nightly=nightly[None, :])
+    result = evaluate_str(grid_inputs, purchase)
+    shape = (occupancy.size, nightly.size)
+    return StrGrid(occupancy, nightly, np.broadcast_to(result.cash_yr, shape), np.broadcast_to(result.coc, shape))
@@ -0,0 +1,246 @@
+"""
+HTTP JSON API for deal evaluation: a dependency-free ASGI app, plus a small asyncio HTTP/1.1 server to run it.
+
+    python server.py --port 8000          # built-in server
+    uvicorn server:app --port 8000        # or any ASGI server
+
+Endpoints (inputs are named like the app inputs, e.g. price, deposit_pct, monthly_rent; missing = app default):
+    GET  /health            -> {"status": "ok"}
+    POST /evaluate          {"price": 250000, "monthly_rent": 1200, ...}
+                            -> {"purchase": {...}, "ltr": {...}, "str": {...}}
+    POST /evaluate/batch    {"deals": [{...}, {...}, ...]}  or columnar {"columns": {"price": [...], ...}}
+                            -> {"n": N, "results": {"deposit": [...], "lt_coc": [...], "st_coc": [...], ...}}
+
+/evaluate uses the scalar path of calc; /evaluate/batch turns the request into columns and evaluates them in one
+vectorized pass (calc.evaluate_columns). Throughput target: 10k+ deals/sec per core on /evaluate/batch with
+requests of a few thousand deals; JSON decoding/encoding, not the maths, is the bulk of the cost
+(see benchmarks/bench_server.py). Non-finite results are returned as null.
+"""
+import argparse
+import asyncio
+import json
+from dataclasses import fields
+
+import numpy as np
+
+from calc import INPUT_CLASSES, INPUT_DEFAULTS, PurchaseInputs, evaluate_columns, evaluate_deal
+
+MAX_BODY = 64 * 1024 * 1024
+
+
+class BadRequest(Exception):
+    pass
+
+
+# ---------------------------- Handlers ----------------------------
+def _check_names(names) -> None:
+    unknown = set(names) - set(INPUT_DEFAULTS)
+    if unknown:
+        raise BadRequest(f"unknown inputs: {', '.join(sorted(unknown))}")
+
+
+def evaluate_one(body: dict) -> dict:
+    if not isinstance(body, dict):
+        raise BadRequest("expected a JSON object of inputs")
+    _check_names(body)
+    try:
+        deal = evaluate_deal(*(cls(**{f.name: body[f.name] for f in fields(cls) if f.name in body})
+                               for cls in INPUT_CLASSES))
+    except (TypeError, ValueError, ZeroDivisionError) as e:
+        raise BadRequest(f"invalid inputs: {e}")
+    return {"purchase": _json_dict(deal.purchase), "ltr": _json_dict(deal.ltr), "str": _json_dict(deal.str_)}
+
+
+# NaN/inf are not valid JSON; like batch.py's JSONL writer, they become null.
+def _json_list(values: np.ndarray) -> list:
+    finite = np.isfinite(values)
+    if finite.all():
+        return values.tolist()
+    out = values.astype(object)
+    out[~finite] = None
+    return out.tolist()
+
+
+def _json_dict(result) -> dict:
+    return {k: float(v) if np.isfinite(v) else None for k, v in vars(result).items()}
+
+
+def evaluate_batch(body: dict) -> dict:
+    if not isinstance(body, dict) or ("deals" in body) == ("columns" in body):
+        raise BadRequest('expected {"deals": [...]} or {"columns": {...}}')
+    if "deals" in body:
+        deals = body["deals"]
+        if not isinstance(deals, list) or not all(isinstance(d, dict) for d in deals):
+            raise BadRequest('"deals" must be a list of objects')
+        names = set().union(*deals) if deals else set()
+        _check_names(names)
+        columns = {name: [d.get(name, INPUT_DEFAULTS[name]) for d in deals] for name in names}
+        n = len(deals)
+    else:
+        columns = body["columns"]
+        if not isinstance(columns, dict) or not all(isinstance(v, list) for v in columns.values()):
+            raise BadRequest('"columns" must map input names to lists')
+        _check_names(columns)
+        lengths = {len(v) for v in columns.values()}
+        if len(lengths) > 1:
+            raise BadRequest("all columns must have the same length")
+        n = lengths.pop() if lengths else 0
+    if n == 0:
+        return {"n": 0, "results": {}}
+    if not columns:
+        columns = {"price": [PurchaseInputs.price] * n}
+    try:
+        results = evaluate_columns(columns)
+    except (TypeError, ValueError) as e:
+        raise BadRequest(f"invalid inputs: {e}")
+    return {"n": n, "results": {k: _json_list(v) for k, v in results.items()}}
+
+
+ROUTES = {
+    ("GET", "/health"): lambda body: {"status": "ok"},
+    ("POST", "/evaluate"): evaluate_one,
+    ("POST", "/evaluate/batch"): evaluate_batch,
+}
+
+
+def handle(method: str, path: str, body: bytes) -> tuple[int, dict]:
+    route = ROUTES.get((method, path.rstrip("/") or "/"))
+    if route is None:
+        if any(p == path.rstrip("/") for _, p in ROUTES):
+            return 405, {"error": "method not allowed"}
+        return 404, {"error": "not found"}
+    try:
+        payload = json.loads(body) if body else {}
+    except ValueError:
+        return 400, {"error": "body is not valid JSON"}
+    try:
+        return 200, route(payload)
+    except BadRequest as e:
+        return 400, {"error": str(e)}
+
+
+# ---------------------------- ASGI ----------------------------
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    if scope["type"] != "http":
+        return
+
+    chunks, size, more = [], 0, True
+    while more:
+        message = await receive()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY:
+            status, payload = 413, {"error": "request body too large"}
+            break
+        chunks.append(chunk)
+        more = message.get("more_body", False)
+    else:
+        status, payload = handle(scope["method"], scope["path"], b"".join(chunks))
+
+    data = json.dumps(payload).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(data)).encode())],
+    })
+    await send({"type": "http.response.body", "body": data})
+
+
+# ---------------------------- Built-in HTTP/1.1 server ----------------------------
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+def _write_error(writer: asyncio.StreamWriter, status: int, message: str) -> None:
+    """An error response for a request that never reaches `app` (the connection is closed after it)."""
+    data = json.dumps({"error": message}).encode()
+    writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\ncontent-type: application/json\r\n"
+                 f"content-length: {len(data)}\r\nconnection: close\r\n\r\n".encode() + data)
+
+
+async def _serve_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Minimal keep-alive HTTP/1.1 for `app`: Content-Length bodies only, no chunked requests."""
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                return
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            headers = {}
+            for line in header_lines:
+                if ":" in line:
+                    k, v = line.split(":", 1)
+                    headers[k.strip().lower()] = v.strip()
+            try:
+                method, target, version = request_line.split(" ", 2)
+                length = int(headers.get("content-length", 0))
+                if length < 0:
+                    raise ValueError(length)
+            except ValueError:
+                _write_error(writer, 400, "malformed request line or content-length")
+                await writer.drain()
+                return
+            if length > MAX_BODY:
+                _write_error(writer, 413, "request body too large")
+                await writer.drain()
+                return
+            try:
+                body = await reader.readexactly(length)
+            except asyncio.IncompleteReadError:
+                return
+
+            scope = {
+                "type": "http", "asgi": {"version": "3.0"}, "http_version": version.split("/")[-1],
+                "method": method, "path": target.split("?", 1)[0], "query_string": target.partition("?")[2].encode(),
+                "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+            }
+            response = {}
+
+            async def receive():
+                return {"type": "http.request", "body": body, "more_body": False}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    response.update(message)
+                else:
+                    status = response["status"]
+                    lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}"]
+                    lines += [f"{k.decode()}: {v.decode()}" for k, v in response["headers"]]
+                    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + message.get("body", b""))
+
+            await app(scope, receive, send)
+            await writer.drain()
+            if headers.get("connection", "").lower() == "close":
+                return
+    finally:
+        writer.close()
+
+
+async def serve(host: str, port: int) -> None:
+    server = await asyncio.start_server(_serve_connection, host, port, limit=1024 * 1024)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the deal evaluation JSON API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+    print(f"Serving on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
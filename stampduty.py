@@ -0,0 +1,140 @@
+"""
+Stamp duty engine for additional-property (BTL) purchases: SDLT (England & NI), LBTT + ADS (Scotland) and
+LTT higher rates (Wales).
+
+Band tables are data (stamp_duty_bands.json), versioned by effective date. Each table is compiled once into
+threshold / marginal-rate / cumulative-tax arrays, so a price only needs its own band: one `np.searchsorted`
+per deal, or for a single price one `bisect` and one multiply-add on plain tuples. `stamp_duty` is vectorized over prices and regions, so mixed-jurisdiction batches are one call.
+"""
+import bisect
+import datetime
+import json
+import os
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+BANDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stamp_duty_bands.json")
+DEFAULT_REGION = "england"
+
+
+@dataclass(frozen=True)
+class TaxTable:
+    """One compiled band table: tax(p) = cumulative[i] + (p - thresholds[i]) × rates[i], i = band of p."""
+    region: str
+    effective_from: datetime.date
+    thresholds: np.ndarray  # band lower bounds, ascending, from 0
+    rates: np.ndarray       # marginal rate in each band, surcharge included
+    cumulative: np.ndarray  # tax due at each threshold
+
+    def __post_init__(self):
+        # Python-float copies for the scalar path: bisect on a tuple beats any NumPy call for one price.
+        object.__setattr__(self, "_bands", (tuple(self.thresholds.tolist()), tuple(self.rates.tolist()),
+                                            tuple(self.cumulative.tolist())))
+
+    @classmethod
+    def compile(cls, region: str, spec: dict) -> "TaxTable":
+        thresholds = np.array([b[0] for b in spec["bands"]], dtype=float)
+        rates = np.array([b[1] for b in spec["bands"]], dtype=float) + spec.get("surcharge", 0.0)
+        cumulative = np.concatenate(([0.0], np.cumsum(np.diff(thresholds) * rates[:-1])))
+        exempt_below = float(spec.get("exempt_below", 0.0))
+        if exempt_below > 0:
+            # Nothing is due below the exemption; from it on, the full banded tax is due (a step, not a slice).
+            i = np.searchsorted(thresholds, exempt_below, side="right") - 1
+            due = cumulative[i] + (exempt_below - thresholds[i]) * rates[i]
+            above = thresholds > exempt_below
+            thresholds = np.concatenate(([0.0, exempt_below], thresholds[above]))
+            cumulative = np.concatenate(([0.0, due], cumulative[above]))
+            rates = np.concatenate(([0.0, rates[i]], rates[above]))
+        return cls(region, datetime.date.fromisoformat(spec["from"]), thresholds, rates, cumulative)
+
+    def tax_one(self, price: float) -> float:
+        thresholds, rates, cumulative = self._bands
+        i = max(bisect.bisect_right(thresholds, price) - 1, 0)
+        return max(cumulative[i] + (price - thresholds[i]) * rates[i], 0.0)
+
+    def tax(self, prices) -> np.ndarray:
+        p = np.asarray(prices, dtype=float)
+        i = np.clip(np.searchsorted(self.thresholds, p, side="right") - 1, 0, None)
+        return np.maximum(self.cumulative[i] + (p - self.thresholds[i]) * self.rates[i], 0.0)
+
+
+@dataclass(frozen=True)
+class Regime:
+    name: str
+    label: str
+    tables: tuple  # TaxTable, oldest first
+
+    def __post_init__(self):
+        # (local midnight ending today, today's table): date.today() costs more than the tax itself, so the
+        # default lookup is resolved once per local day and kept on this regime (not shared by name).
+        object.__setattr__(self, "_today", (float("-inf"), None))
+
+    def table(self, on: datetime.date | None = None) -> TaxTable:
+        """The table in force on `on` (default today); the oldest one for earlier dates."""
+        if on is None:
+            valid_until, table = self._today
+            if time.time() >= valid_until:
+                today = datetime.date.today()
+                table = self.table(today)
+                midnight = datetime.datetime.combine(today + datetime.timedelta(days=1), datetime.time())
+                object.__setattr__(self, "_today", (midnight.timestamp(), table))
+            return table
+        current = self.tables[0]
+        for table in self.tables:
+            if table.effective_from <= on:
+                current = table
+        return current
+
+
+@lru_cache(maxsize=None)
+def _read(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def load_regimes(path: str = BANDS_PATH) -> dict[str, Regime]:
+    regimes = {}
+    for name, spec in _read(path)["regimes"].items():
+        tables = sorted((TaxTable.compile(name, t) for t in spec["tables"]), key=lambda t: t.effective_from)
+        regimes[name] = Regime(name, spec["label"], tuple(tables))
+    return regimes
+
+
+@lru_cache(maxsize=None)
+def _aliases(path: str = BANDS_PATH) -> dict[str, str]:
+    out = {"": DEFAULT_REGION, "nan": DEFAULT_REGION, "none": DEFAULT_REGION}  # missing cells in batch files
+    for name, spec in _read(path)["regimes"].items():
+        out[name] = name
+        out.update({alias: name for alias in spec.get("aliases", [])})
+    return out
+
+
+def regime(region: str, path: str = BANDS_PATH) -> Regime:
+    """Look up a regime by name or alias (case-insensitive); blank means England & NI."""
+    key = _aliases(path).get(str(region).strip().lower())
+    if key is None:
+        raise ValueError(f"unknown region {region!r}; expected one of: {', '.join(load_regimes(path))}")
+    return load_regimes(path)[key]
+
+
+def stamp_duty(price, region=DEFAULT_REGION, on: datetime.date | None = None):
+    """
+    Purchase tax on an additional property at `price` in `region`, under the bands in force on `on` (default
+    today). Scalars give a float; arrays of prices and/or regions (broadcast together) give an array.
+    """
+    if isinstance(price, (int, float)) and isinstance(region, str) or np.ndim(price) == 0 and np.ndim(region) == 0:
+        return regime(region).table(on).tax_one(float(price))
+    if np.ndim(region) == 0:
+        return regime(region).table(on).tax(price)
+    price, region = np.broadcast_arrays(np.asarray(price, dtype=float), np.asarray(region))
+    out = np.empty(price.shape)
+    names, inverse = np.unique(region, return_inverse=True)
+    inverse = inverse.reshape(price.shape)
+    for k, name in enumerate(names):
+        mask = inverse == k
+        out[mask] = regime(name).table(on).tax(price[mask])
+    return out
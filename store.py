@@ -0,0 +1,196 @@
+"""
+Persistent scenario store: saved deals and their computed results in a local SQLite file.
+
+Inputs and results are plain columns (one row per named deal), so screens like "STR deals with cash-on-cash
+above 10%" are answered from indexes without re-running the maths. Results are recomputed in one vectorized
+pass whenever the file was written by a different CALC_VERSION.
+
+One DealStore may be shared across threads (the app keeps a single one for every session): each transaction and
+each read holds the store's lock, so one session's commit or rollback never covers another's half-written batch.
+"""
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+from calc import CALC_VERSION, evaluate_columns
+from scenarios import INPUT_FIELDS, ScenarioStore, column_dtype
+
+SCHEMA_VERSION = 2
+DEFAULT_PATH = os.environ.get("PROPERTYAPP_DB", "scenarios.sqlite")
+
+# Result columns persisted next to the inputs (names as returned by evaluate_columns).
+RESULT_FIELDS = ["deposit", "loan", "monthly_payment", "sdlt_due", "upfront_cash"] + [
+    prefix + name
+    for prefix in ("lt_", "st_")
+    for name in ("revenue_yr", "opex_yr", "noi_yr", "mort_yr", "cash_mo", "cash_yr", "gross_yield", "net_yield", "coc")
+]
+INDEXED = ["postcode", "price", "lt_net_yield", "st_net_yield", "lt_coc", "st_coc"]
+SQL_TYPES = {"interest_only": "INTEGER", "region": "TEXT NOT NULL DEFAULT 'england'"}
+STRATEGY_PREFIX = {"LTR": "lt_", "STR": "st_"}
+BATCH = 50_000
+
+
+def _result_key(field: str) -> str:
+    # The input column `sdlt` is the manual override (NULL = auto); the computed tax is stored as `sdlt_due`.
+    return "sdlt" if field == "sdlt_due" else field
+
+
+def _normalise_postcode(postcode) -> str | None:
+    if postcode is None:
+        return None
+    return " ".join(str(postcode).upper().split()) or None
+
+
+class DealStore:
+    """SQLite-backed deals table; one row per unique scenario name."""
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()  # re-entrant: recompute() loads and saves under it
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM deals").fetchone()[0]
+
+    # ---------------------------- Schema ----------------------------
+    def _migrate(self) -> None:
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise RuntimeError(f"{self.path} uses schema v{version}; this build only understands v{SCHEMA_VERSION}")
+        with self.conn:
+            if version == 0:
+                columns = ", ".join(
+                    [f"{name} {SQL_TYPES.get(name, 'REAL')}" for name in INPUT_FIELDS]
+                    + [f"{name} REAL" for name in RESULT_FIELDS]
+                )
+                self.conn.execute(
+                    "CREATE TABLE deals (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, postcode TEXT, "
+                    f"{columns}, saved_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+                )
+                for column in INDEXED:
+                    self.conn.execute(f"CREATE INDEX deals_{column} ON deals({column})")
+                self.conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+                self.conn.execute("INSERT INTO meta VALUES ('calc_version', ?)", (str(CALC_VERSION),))
+            if 0 < version < 2:  # v2: stamp duty region
+                self.conn.execute(f"ALTER TABLE deals ADD COLUMN region {SQL_TYPES['region']}")
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        stored = self.conn.execute("SELECT value FROM meta WHERE key = 'calc_version'").fetchone()[0]
+        if int(stored) != CALC_VERSION:
+            self.recompute()
+
+    # ---------------------------- Writes ----------------------------
+    def save(self, names, columns, postcodes=None) -> None:
+        """Upsert deals by name: `columns` maps every input field to one value per name (sdlt NaN = auto)."""
+        names = list(names)
+        if not names:
+            return
+        columns = {k: np.asarray(columns[k]) for k in INPUT_FIELDS}
+        results = evaluate_columns(columns)
+        postcodes = [_normalise_postcode(p) for p in postcodes] if postcodes is not None else [None] * len(names)
+
+        fields = ["name", "postcode"] + INPUT_FIELDS + RESULT_FIELDS
+        sql = (
+            f"INSERT INTO deals ({', '.join(fields)}) VALUES ({', '.join('?' * len(fields))}) "
+            f"ON CONFLICT(name) DO UPDATE SET "
+            + ", ".join(f"{f} = excluded.{f}" for f in fields[1:])
+            + ", saved_at = CURRENT_TIMESTAMP"
+        )
+        with self._lock, self.conn:
+            for start in range(0, len(names), BATCH):
+                part = slice(start, start + BATCH)
+                values = [names[part], postcodes[part]]
+                values += [_sql_values(columns[k][part]) for k in INPUT_FIELDS]
+                values += [_sql_values(results[_result_key(k)][part]) for k in RESULT_FIELDS]
+                self.conn.executemany(sql, zip(*values))
+
+    def save_scenarios(self, scenarios: ScenarioStore, postcodes=None) -> None:
+        self.save(scenarios.names, scenarios.columns, postcodes)
+
+    def delete(self, names) -> None:
+        with self._lock, self.conn:
+            self.conn.executemany("DELETE FROM deals WHERE name = ?", [(n,) for n in names])
+
+    def recompute(self) -> None:
+        """Re-evaluate every saved deal with the current calculation core."""
+        with self._lock:
+            scenarios = self.load()
+            postcodes = [r[0] for r in self.conn.execute("SELECT postcode FROM deals ORDER BY id")]
+            self.save_scenarios(scenarios, postcodes)
+            with self.conn:
+                self.conn.execute("UPDATE meta SET value = ? WHERE key = 'calc_version'", (str(CALC_VERSION),))
+
+    # ---------------------------- Reads ----------------------------
+    def load(self, names=None) -> ScenarioStore:
+        """Saved inputs as a ScenarioStore (all deals in save order, or just `names`)."""
+        sql = f"SELECT name, {', '.join(INPUT_FIELDS)} FROM deals"
+        with self._lock:
+            rows = (
+                self.conn.execute(sql + " ORDER BY id").fetchall() if names is None
+                else [r for n in names for r in self.conn.execute(sql + " WHERE name = ?", (n,))]
+            )
+        scenarios = ScenarioStore()
+        if rows:
+            data = list(zip(*rows))
+            scenarios.names = list(data[0])
+            for name, values in zip(INPUT_FIELDS, data[1:]):
+                scenarios.columns[name] = np.array(
+                    [np.nan if v is None else v for v in values],
+                    dtype=column_dtype(name),
+                )
+        return scenarios
+
+    def query(self, strategy: str | None = None, min_coc=None, min_yield=None, min_price=None, max_price=None,
+              postcode: str | None = None, order_by: str | None = None, limit: int | None = 1000) -> dict[str, list]:
+        """
+        Saved deals matching every given filter, as columns. `strategy` ("LTR"/"STR") picks which coc/yield the
+        thresholds apply to; `postcode` matches a prefix (e.g. "SW1"); `order_by` is any stored column, descending.
+        """
+        prefix = STRATEGY_PREFIX[strategy.upper()] if strategy else "lt_"
+        where, params = [], []
+        for column, op, value in (
+            (prefix + "coc", ">=", min_coc), (prefix + "net_yield", ">=", min_yield),
+            ("price", ">=", min_price), ("price", "<=", max_price),
+        ):
+            if value is not None:
+                where.append(f"{column} {op} ?")
+                params.append(value)
+        lo = _normalise_postcode(postcode)
+        if lo:
+            # Range rather than LIKE so the postcode index is used.
+            where.append("postcode >= ? AND postcode < ?")
+            params += [lo, lo + "\uffff"]
+
+        fields = ["name", "postcode"] + INPUT_FIELDS + RESULT_FIELDS
+        if order_by is not None and order_by not in fields:
+            raise ValueError(f"unknown column {order_by!r}")
+        sql = f"SELECT {', '.join(fields)} FROM deals"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order_by} DESC" if order_by else " ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return {name: list(values) for name, values in zip(fields, zip(*rows))} if rows else {f: [] for f in fields}
+
+
+def _sql_values(array: np.ndarray) -> list:
+    """Python scalars for sqlite3 (which stores NaN as NULL)."""
+    return np.asarray(array).tolist()